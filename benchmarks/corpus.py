@@ -0,0 +1,37 @@
+# Fixed puzzle corpus shared by the benchmark scripts ("." marks an empty cell)
+CORPUS = {
+    # Solved in milliseconds by any approach
+    "easy": {
+        "euler_01": "..3.2.6..9..3.5..1..18.64....81.29..7.......8..67.82....26.95..8..2.3..9..5.1.3..",
+        "euler_02": "2...8.3...6..7..84.3.5..2.9...1.54.8.........4.27.6...3.1..7.4.72..4..6...4.1...3",
+        "wikipedia": "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79",
+    },
+    # Takes the legacy column-major backtracking a few seconds
+    "hard": {
+        "ai_escargot": "1....7.9..3..2...8..96..5....53..9...1..8...26....4...3......1..4......7..7...3..",
+        "norvig_top95_01": "85...24..72......9..4.........1.7..23.5...9...4...........8..7..17..........36.4.",
+        "norvig_top95_02": "52...6.........7.13...........4..8..6......5...........418.........3..2...87.....",
+    },
+    # Tens of seconds to minutes for the legacy backtracking
+    "pathological": {
+        "norvig_hardest": "4.....8.5.3..........7......2.....6.....8.4......1.......6.3.7.5..2.....1.4......",
+        "golden_nugget": "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4..",
+        "norvig_top95_03": "6.....8.3.4.7.................5.4.7.3..2.....1.6.......2.....5.....8.6......1....",
+        "anti_brute_force": "..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1........4...9",
+    },
+}
+
+
+def parse_grid(text):
+    # Convert an 81-character puzzle string into a 9x9 list of lists (0 = empty)
+    values = [0 if ch in ".0" else int(ch) for ch in text]
+    return [values[row * 9:row * 9 + 9] for row in range(9)]
+
+
+def iter_corpus(categories=None):
+    # Yield (category, name, grid) for every puzzle in the selected categories
+    for category, puzzles in CORPUS.items():
+        if categories and category not in categories:
+            continue
+        for name, text in puzzles.items():
+            yield category, name, parse_grid(text)
@@ -0,0 +1,87 @@
+"""
+Measure SudokuBoard.generate() latency per difficulty against a latency budget.
+
+Every generated puzzle is also checked for a unique solution. Boards whose generate() gave
+up (node or time budget spent) are counted as failed instead. The script exits with
+status 1 if a puzzle is not unique or the p95 latency of a difficulty exceeds the budget.
+--method transform derives puzzles from cached seeds (see PuzzleTransformer); its first
+puzzle per difficulty includes the seed search. With --method search every board gets its own
+seed (derived from --seed), so a run generates the same puzzles whatever --count or the
+order of the difficulties.
+
+Usage (from the project root):
+    python -m benchmarks.generation_benchmark [--count 100] [--budget-ms 100] [--solver dlx] [--rated]
+    python -m benchmarks.generation_benchmark --box-size 4 --count 20 --budget-ms 500   # 16x16 boards
+    python -m benchmarks.generation_benchmark --method transform --count 10000
+    python -m benchmarks.generation_benchmark --max-nodes 2000   # Cap every solver call (see SolverBudget)
+"""
+import argparse
+import itertools
+import random
+import sys
+
+from benchmarks.harness import summarize, time_call
+from core.SolverBudget import SolverBudget, get_exhaustion_stats
+from core.SudokuBoard import SOLVER_BACKENDS, SudokuBoard
+
+DIFFICULTIES = ["easy", "medium", "hard", "advanced"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark puzzle generation latency per difficulty.")
+    parser.add_argument("--count", type=int, default=100, help="puzzles generated per difficulty")
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="allowed p95 latency per puzzle")
+    parser.add_argument("--solver", default="bitmask", choices=list(SOLVER_BACKENDS))
+    parser.add_argument("--rated", action="store_true",
+                        help="target the technique rating band of each difficulty (see DifficultyRater)")
+    parser.add_argument("--box-size", type=int, default=3, help="2 = 4x4, 3 = 9x9, 4 = 16x16, 5 = 25x25")
+    parser.add_argument("--method", default="search", choices=["search", "transform"])
+    parser.add_argument("--max-nodes", type=int, help="search node budget per solver call")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    failed = False
+
+    print(f"{'difficulty':<10} {'min blanks':>10} {'p50':>9} {'p95':>9} {'max':>9} {'puzzles/s':>10} "
+          f"{'failed':>7}  budget")
+    for difficulty in DIFFICULTIES:
+        boards = []
+        gave_up = []
+        # Seeded boards (same puzzles every run); transform mode uses the shared seed puzzles instead
+        seeds = itertools.count(args.seed * 1_000_000) if args.method == "search" else itertools.repeat(None)
+
+        def generate(board):
+            budget = SolverBudget(max_nodes=args.max_nodes) if args.max_nodes else None
+            generated = board.generate(rating_band=difficulty if args.rated else None, method=args.method,
+                                       budget=budget)
+            (boards if generated else gave_up).append(board)
+
+        samples = time_call(
+            generate,
+            repeat=args.count,
+            setup=lambda: SudokuBoard(difficulty=difficulty, solver=args.solver, box_size=args.box_size,
+                                      seed=next(seeds))
+        )
+        stats = summarize(samples)
+
+        # Boards that gave up hold an empty grid, so only finished puzzles count
+        blanks = [board.count_empty() for board in boards] or [0]
+        if any(board.count_solutions(limit=2) != 1 for board in boards):
+            print(f"{difficulty}: generated a puzzle without a unique solution")
+            failed = True
+
+        within_budget = stats["p95_ms"] <= args.budget_ms
+        failed = failed or not within_budget
+        throughput = len(samples) / sum(samples)
+        print(f"{difficulty:<10} {min(blanks):>10} {stats['p50_ms']:>7.1f}ms {stats['p95_ms']:>7.1f}ms "
+              f"{stats['max_ms']:>7.1f}ms {throughput:>10.0f} "
+              f"{len(gave_up):>7}  {'ok' if within_budget else 'OVER'}")
+
+    if args.max_nodes:
+        print(f"\nSolver calls stopped by the node budget: {get_exhaustion_stats().get('nodes', 0)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import json
+import math
+import statistics
+import time
+import tracemalloc
+
+
+def time_call(func, repeat=1, setup=None):
+    # Run func `repeat` times and return the wall time of each run in seconds.
+    # setup() is called before every run (outside the timed region) and its result is passed to func
+    samples = []
+    for _ in range(repeat):
+        args = (setup(),) if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def percentile(samples, pct):
+    # Nearest-rank percentile of a list of samples
+    ordered = sorted(samples)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def summarize(samples):
+    # Basic timing statistics in milliseconds
+    return {
+        "runs": len(samples),
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "max_ms": max(samples) * 1000,
+    }
+
+
+def measure_allocations(func, setup=None):
+    # Memory allocated by one run of func, traced with tracemalloc (much slower, so never timed):
+    # peak_kib is the high-water mark during the run, retained_kib what is still allocated after it
+    args = (setup(),) if setup else ()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        func(*args)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_kib": (peak - before) / 1024, "retained_kib": (current - before) / 1024}
+
+
+def write_json(path, data):
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+
+
+def read_json(path):
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def find_regressions(results, baseline, tolerance=0.5, min_delta_ms=0.05, min_delta_kib=16):
+    # Cases slower (p50) or allocating more (peak) than the baseline by more than `tolerance`
+    # (0.5 = 50%); the absolute floors keep timer noise on sub-millisecond cases from being flagged.
+    # Returns a list of (case, metric, baseline value, new value)
+    regressions = []
+    for case, stats in results.items():
+        base = baseline.get(case)
+        if not base:
+            continue
+        for metric, floor in (("p50_ms", min_delta_ms), ("peak_kib", min_delta_kib)):
+            if metric in stats and metric in base:
+                old, new = base[metric], stats[metric]
+                if new > old * (1 + tolerance) and new - old > floor:
+                    regressions.append((case, metric, old, new))
+    return regressions
@@ -0,0 +1,314 @@
+"""
+Headless render benchmark: drives every screen for a number of frames with scripted input
+(typing, clicks, scrolling, moves and hints on the board) and reports per screen the frame
+time distribution, the memory one steady frame allocates, and per frame the blits, fills,
+draw calls and pixels pushed to the display.
+
+Runs under SDL's dummy video and audio drivers, so no display or sound device is needed
+(CI, SSH sessions). Like the suite, results can be written as JSON and compared with a
+stored baseline; the script exits with status 1 when a screen got slower or allocates more
+(see harness.find_regressions). A baseline recorded with another --box-size is not compared.
+The statistics screen needs the analytics dependencies (matplotlib, pandas, seaborn) and is
+skipped without them.
+
+Usage (from the project root):
+    python -m benchmarks.render_benchmark [--frames 300] [--only play menu] [--output render.json]
+    python -m benchmarks.render_benchmark --box-size 4       # Play screens on a 16x16 board
+    python -m benchmarks.render_benchmark --save-baseline    # Refresh benchmarks/render_baseline.json
+"""
+import argparse
+import itertools
+import os
+import platform
+import random
+import sys
+import time
+import types
+from collections import Counter
+
+# Must be set before pygame initializes (core.constants does that on import)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.harness import find_regressions, measure_allocations, read_json, summarize, time_call, write_json
+from core.constants import HEIGHT, WIDTH
+from core.AuthScreen import AuthScreen
+from core.HintEngine import HintEngine
+from core.HowToPlay import HowToPlay
+from core.Leaderboard import Leaderboard
+from core.Menu import Menu
+from core.PlayScreen import PlayScreen
+from core.SudokuGame import SudokuGame
+from core.SudokuRenderer import SudokuRenderer
+from core.UserManager import UserManager
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "render_baseline.json")
+COUNTERS = ("blits", "fills", "draws", "flips", "updates", "pixels")
+
+# Screens play sounds on clicks; the benchmark stays silent
+SILENT = types.SimpleNamespace(play=lambda: None)
+
+# What is counted per frame (reset before the timed frames of every screen)
+counts = Counter()
+
+
+class CountingSurface(pygame.Surface):
+    # Screen surface counting the blits and fills the screens issue on it
+    def blit(self, *args, **kwargs):
+        counts["blits"] += 1
+        return super().blit(*args, **kwargs)
+
+    def fill(self, *args, **kwargs):
+        counts["fills"] += 1
+        return super().fill(*args, **kwargs)
+
+
+def install_counters():
+    # Screens call pygame.draw.* and pygame.display.flip/update through the modules, so wrapping the
+    # module functions counts every call, including the pixels each display update pushes
+    for name in ("rect", "line", "circle"):
+        def draw(*args, _draw=getattr(pygame.draw, name), **kwargs):
+            counts["draws"] += 1
+            return _draw(*args, **kwargs)
+        setattr(pygame.draw, name, draw)
+
+    flip, update = pygame.display.flip, pygame.display.update
+
+    def counted_flip():
+        counts["flips"] += 1
+        counts["pixels"] += WIDTH * HEIGHT
+        return flip()
+
+    def counted_update(rects=None):
+        counts["updates"] += 1
+        if rects is None:
+            counts["pixels"] += WIDTH * HEIGHT
+            return update()
+        rects = [rects] if isinstance(rects, pygame.Rect) else rects
+        counts["pixels"] += sum(rect.width * rect.height for rect in rects)
+        return update(rects)
+
+    pygame.display.flip, pygame.display.update = counted_flip, counted_update
+
+
+def key(char):
+    return pygame.event.Event(pygame.KEYDOWN, key=pygame.key.key_code(char), unicode=char, mod=0)
+
+
+def press(code):
+    return pygame.event.Event(pygame.KEYDOWN, key=code, unicode="", mod=0)
+
+
+def click(pos):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1)
+
+
+# Every screen: (name, build) where build(screen, args) returns a function drawing frame i
+
+def auth_screen(screen, args):
+    # Types a name, deletes now and then, moves the focus and switches between login and create
+    auth = AuthScreen(screen, UserManager(), None, SILENT)
+    letters = "benchplayer"
+
+    def frame(i):
+        if i % 40 == 39 and auth.switch_mode_button:
+            auth.handle_event(click(auth.switch_mode_button.center))
+        elif i % 20 == 19 and auth.password_box:
+            auth.handle_event(click(auth.password_box.center))
+        elif i % 20 == 9 and auth.username_box:
+            auth.handle_event(click(auth.username_box.center))
+        elif i % 8 == 7:
+            auth.handle_event(press(pygame.K_BACKSPACE))
+        else:
+            auth.handle_event(key(letters[i % len(letters)]))
+        auth.draw()
+    return frame
+
+
+def menu_screen(screen, args):
+    # Hover follows the real mouse, which the dummy driver never moves: the menu only redraws
+    menu = Menu(screen)
+    tracker = types.SimpleNamespace(get_level=lambda: 4, get_points=lambda: 37)
+
+    def frame(i):
+        menu.draw(tracker, "bench", "Bear")
+    return frame
+
+
+def play_select_screen(screen, args):
+    # Cycles the board size button
+    play_select = PlayScreen(screen, SILENT)
+
+    def frame(i):
+        if i % 20 == 19 and play_select.button_rects:
+            play_select.handle_click(play_select.button_rects[4].center)
+        play_select.draw()
+    return frame
+
+
+def play_game(screen, args, full_redraw=False):
+    # A seeded game: moves between cells, types digits (some wrong), takes hints and undoes, with
+    # the timer advancing once every 60 frames. full_redraw repaints everything every frame
+    renderer = SudokuRenderer(screen)
+    game = SudokuGame(difficulty="medium", renderer=renderer, box_size=args.box_size, seed=args.seed,
+                      hint_engine=HintEngine())
+    game.start_new_game()
+    rng = random.Random(args.seed)
+    size = game.board.size
+
+    def frame(i):
+        if i % 90 == 89:
+            game.get_hint()
+        elif i % 45 == 44:
+            game.undo()
+        elif i % 15 == 14:
+            row, col = rng.randrange(size), rng.randrange(size)
+            game.select_cell((renderer.grid_origin_x + col * renderer.cell_size + 1,
+                              renderer.grid_origin_y + row * renderer.cell_size + 1))
+            game.input_number(rng.randint(1, size))
+        if full_redraw:
+            renderer.invalidate()
+        seconds = i // 60
+        renderer.draw_board(game.board, game.selected_cell, game.last_hint)
+        renderer.draw_elements(f"{seconds // 60:02d}:{seconds % 60:02d}", False, game.hints_used,
+                               game.count_filled_cells())
+        renderer.update_display()
+    return frame
+
+
+def leaderboard_screen(screen, args):
+    # Scrolls down and back up
+    leaderboard = Leaderboard(screen, UserManager())
+
+    def frame(i):
+        leaderboard.handle_event(press(pygame.K_DOWN if i % 20 < 10 else pygame.K_UP))
+        leaderboard.draw()
+    return frame
+
+
+def stats_screen(screen, args):
+    # Scrolls through the graphs. Graphs are not generated here; missing ones are simply not drawn
+    from core.GameStatsScreen import GameStatsScreen
+    stats = GameStatsScreen(screen)
+    stats.stats_generated = True
+
+    def frame(i):
+        stats.handle_event(press(pygame.K_DOWN if i % 20 < 10 else pygame.K_UP))
+        stats.draw()
+    return frame
+
+
+def how_to_play_screen(screen, args):
+    how_to_play = HowToPlay(screen)
+
+    def frame(i):
+        how_to_play.draw()
+    return frame
+
+
+SCREENS = {
+    "auth": auth_screen,
+    "menu": menu_screen,
+    "play_select": play_select_screen,
+    "play": play_game,
+    "play_full_redraw": lambda screen, args: play_game(screen, args, full_redraw=True),
+    "leaderboard": leaderboard_screen,
+    "stats": stats_screen,
+    "howto": how_to_play_screen,
+}
+
+
+def run_screen(build, args):
+    # Warm up (fonts, caches, first full frame), trace one steady frame, then time the rest
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    frame = build(CountingSurface((WIDTH, HEIGHT)), args)
+    frames = itertools.count()
+    for _ in range(args.warmup):
+        frame(next(frames))
+    allocations = measure_allocations(lambda: frame(next(frames)))
+
+    counts.clear()
+    stats = summarize(time_call(lambda: frame(next(frames)), repeat=args.frames))
+    stats.update(allocations)
+    for name in COUNTERS:
+        stats[f"{name}_per_frame"] = counts[name] / args.frames
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rendering of every screen without a display.")
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per screen")
+    parser.add_argument("--warmup", type=int, default=10, help="untimed frames before measuring")
+    parser.add_argument("--only", nargs="+", choices=list(SCREENS), help="run only these screens")
+    parser.add_argument("--box-size", type=int, default=3, choices=(2, 3, 4, 5),
+                        help="board size of the play screens (3 = 9x9, 4 = 16x16)")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed slowdown / extra allocation over the baseline (0.5 = 50%%)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    install_counters()
+    results = {}
+    skipped = {}
+
+    print(f"{'screen':<24} {'frames':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'peak KiB':>9} "
+          f"{'blits':>7} {'draws':>7} {'Kpx out':>8}")
+    for name in args.only or SCREENS:
+        try:
+            stats = run_screen(SCREENS[name], args)
+        except ImportError as error:
+            skipped[name] = str(error)
+            print(f"{name:<24} skipped: {error}")
+            continue
+        results[f"render/{name}"] = stats
+        print(f"{name:<24} {stats['runs']:>6} {stats['p50_ms']:>7.2f}ms {stats['p95_ms']:>7.2f}ms "
+              f"{stats['p99_ms']:>7.2f}ms {stats['peak_kib']:>9.1f} {stats['blits_per_frame']:>7.1f} "
+              f"{stats['draws_per_frame']:>7.1f} {stats['pixels_per_frame'] / 1000:>8.1f}")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pygame": pygame.version.ver,
+            "video_driver": os.environ["SDL_VIDEODRIVER"],
+            "seed": args.seed,
+            "frames": args.frames,
+            "box_size": args.box_size,
+            "skipped": skipped,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.output:
+        write_json(args.output, report)
+    if args.save_baseline:
+        write_json(args.baseline, report)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}, nothing to compare (use --save-baseline)")
+        return
+    baseline = read_json(args.baseline)
+    if baseline["meta"].get("box_size", 3) != args.box_size:
+        # Play screens of another board size are not comparable, e.g. a 25x25 run against a 9x9 baseline
+        print(f"\nBaseline {args.baseline} was recorded with --box-size {baseline['meta'].get('box_size', 3)}, "
+              f"not compared (use --baseline or --save-baseline)")
+        return
+    regressions = find_regressions(results, baseline["results"], args.tolerance)
+    if not regressions:
+        print(f"\nNo regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+        return
+    print(f"\nRegressions against {args.baseline} (tolerance {args.tolerance:.0%}):")
+    for case, metric, old, new in regressions:
+        print(f"  {case:<36} {metric:<9} {old:>9.2f} -> {new:>9.2f}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
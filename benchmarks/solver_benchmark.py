@@ -0,0 +1,90 @@
+"""
+Compare the solver backends available to SudokuBoard on the fixed corpus.
+
+Reports the median solve time and search node count of every backend with the speedup
+over the legacy backtracking solver, then times counting every solution of an
+under-constrained grid (the check used when validating imported puzzles).
+
+Usage (from the project root):
+    python -m benchmarks.solver_benchmark [--repeat 20] [--backends bitmask dlx] [--legacy-pathological]
+"""
+import argparse
+import random
+
+from benchmarks.corpus import CORPUS, iter_corpus, parse_grid
+from benchmarks.harness import summarize, time_call
+from core.SudokuBoard import SOLVER_BACKENDS
+
+LEGACY = "backtracking"
+
+
+def bench_solve(name, grid, repeat, seed):
+    # Time one backend on a fresh copy of the grid for every run
+    solver = SOLVER_BACKENDS[name](rng=random.Random(seed))
+    samples = time_call(solver.solve, repeat=repeat, setup=lambda: [row[:] for row in grid])
+    return summarize(samples), solver.get_stats()["nodes"]
+
+
+def bench_count(name, grid, limit):
+    solver = SOLVER_BACKENDS[name]()
+    counts = []
+    samples = time_call(lambda: counts.append(solver.count_solutions(grid, limit)))
+    return summarize(samples), solver.get_stats()["nodes"], counts[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SudokuBoard solver backends on the fixed corpus.")
+    parser.add_argument("--backends", nargs="+", default=list(SOLVER_BACKENDS), choices=list(SOLVER_BACKENDS))
+    parser.add_argument("--repeat", type=int, default=20, help="runs per puzzle for the fast backends")
+    parser.add_argument("--legacy-repeat", type=int, default=1, help="runs per puzzle for the legacy backtracking")
+    parser.add_argument("--legacy-pathological", action="store_true",
+                        help="also run the legacy backtracking on pathological grids and the counting case "
+                             "(can take minutes)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # The empty grid is what generate() solves to build a new puzzle
+    cases = [("fill", "empty_grid", [[0] * 9 for _ in range(9)])] + list(iter_corpus())
+
+    print(f"{'category':<13} {'puzzle':<18}" + "".join(f" {name + ' p50':>22} {'nodes':>8}" for name in args.backends))
+    for category, name, grid in cases:
+        line = f"{category:<13} {name:<18}"
+        legacy_ms = None
+        for backend in args.backends:
+            if backend == LEGACY and category == "pathological" and not args.legacy_pathological:
+                line += f" {'skipped':>22} {'-':>8}"
+                continue
+
+            repeat = args.legacy_repeat if backend == LEGACY else args.repeat
+            stats, nodes = bench_solve(backend, grid, repeat, args.seed)
+            cell = f"{stats['p50_ms']:.2f}ms"
+            if backend == LEGACY:
+                legacy_ms = stats["p50_ms"]
+            elif legacy_ms:
+                cell += f" ({legacy_ms / stats['p50_ms']:.0f}x)"
+            line += f" {cell:>22} {nodes:>8}"
+        print(line)
+
+    # Counting: the first puzzle with its first 8 givens blanked has many solutions
+    grid = parse_grid(CORPUS["easy"]["euler_01"])
+    blanked = 0
+    for row in grid:
+        for col in range(9):
+            if row[col] and blanked < 8:
+                row[col] = 0
+                blanked += 1
+
+    print(f"\n{'count_solutions':<32}" + "".join(f" {name + ' time':>22} {'nodes':>8}" for name in args.backends))
+    line = f"{'euler_01 minus 8 givens':<32}"
+    for backend in args.backends:
+        if backend == LEGACY and not args.legacy_pathological:
+            line += f" {'skipped':>22} {'-':>8}"
+            continue
+        stats, nodes, count = bench_count(backend, grid, limit=100000)
+        cell = f"{count} in {stats['p50_ms']:.1f}ms"
+        line += f" {cell:>22} {nodes:>8}"
+    print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Benchmark suite for the hot paths of a game: SudokuBoard.solve on the fixed corpus,
+generate() per difficulty, _is_valid/is_move_valid, set_cell with its conflict index,
+SudokuGame.is_completed and get_hint (searched and cached, see HintEngine).
+
+Every case reports p50/p95/p99/max wall time and, from one extra traced run, the memory it
+allocates. Results can be written as JSON and compared with a stored baseline: the script
+exits with status 1 when a case got slower or allocates more than the baseline allows
+(see harness.find_regressions). Boards are seeded, so every run measures the same puzzles.
+Nothing here opens a window, so it runs headless (CI, SSH sessions).
+
+Usage (from the project root):
+    python -m benchmarks.suite [--repeat 30] [--only solve generate] [--output results.json]
+    python -m benchmarks.suite --save-baseline          # Refresh benchmarks/baseline.json
+    python -m benchmarks.suite --baseline other.json --tolerance 0.25
+"""
+import argparse
+import itertools
+import os
+import platform
+import random
+import sys
+import time
+
+from benchmarks.corpus import iter_corpus
+from benchmarks.harness import find_regressions, measure_allocations, read_json, summarize, time_call, write_json
+from core.SudokuBoard import SudokuBoard
+from core.HintEngine import HintEngine
+from core.SudokuGame import SudokuGame
+
+DIFFICULTIES = ["easy", "medium", "hard", "advanced"]
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+
+
+def solve_cases(seed):
+    # (name, func, setup, repeat scale): the empty grid is what generate() fills first
+    cases = [("fill", "empty_grid", None)] + list(iter_corpus())
+    for category, name, grid in cases:
+        yield (f"solve/{category}/{name}", SudokuBoard.solve,
+               lambda grid=grid: SudokuBoard(board=grid, seed=seed), 0.3 if category == "pathological" else 1)
+
+
+def generate_cases(seed):
+    for difficulty in DIFFICULTIES:
+        seeds = itertools.count(seed * 1_000_000)
+        yield (f"generate/{difficulty}", SudokuBoard.generate,
+               lambda difficulty=difficulty, seeds=seeds: SudokuBoard(difficulty=difficulty, seed=next(seeds)), 0.5)
+
+
+def validation_cases(seed):
+    # One run checks every digit in every cell of a half-filled board (729 calls)
+    board = SudokuBoard(difficulty="medium", seed=seed)
+    board.generate()
+    positions = [(row, col, number) for row in range(9) for col in range(9) for number in range(1, 10)]
+
+    def is_valid_sweep(board):
+        for row, col, number in positions:
+            board._is_valid(number, (row, col))
+
+    def is_move_valid_sweep(board):
+        for row, col, number in positions:
+            board.is_move_valid(number, (row, col))
+
+    yield "validate/_is_valid x729", is_valid_sweep, lambda: board, 1
+    yield "validate/is_move_valid x729", is_move_valid_sweep, lambda: board, 1
+
+
+def edit_cases(seed):
+    # Keystroke path: set_cell keeps the masks, counts and conflict index up to date. The full rescan
+    # is what a renderer would pay per frame without the index
+    board = SudokuBoard(difficulty="medium", seed=seed)
+    board.generate()
+    rng = random.Random(seed)
+    open_cells = list(board.empty_cells)
+    moves = [(*divmod(rng.choice(open_cells), 9), rng.randint(0, 9)) for _ in range(1000)]
+
+    def set_cell_1000(board):
+        for row, col, value in moves:
+            board.set_cell(row, col, value)
+
+    def read_conflicts_1000(board):
+        for _ in range(1000):
+            if board.conflict_cells:
+                pass
+
+    def rescan_conflicts(board):
+        cells = board.cells
+        conflicts = set()
+        for unit in board.geometry.units:
+            for i in unit:
+                if cells[i] and sum(1 for j in unit if cells[j] == cells[i]) > 1:
+                    conflicts.add(i)
+        return conflicts
+
+    def edited_board():
+        edited = board.copy()
+        set_cell_1000(edited)
+        return edited
+
+    yield "edit/set_cell x1000", set_cell_1000, board.copy, 1
+    yield "edit/read conflict_cells x1000", read_conflicts_1000, edited_board, 1
+    yield "edit/rescan conflicts (reference)", rescan_conflicts, edited_board, 1
+
+
+def game_cases(seed):
+    board = SudokuBoard(difficulty="hard", seed=seed)
+    board.generate()
+
+    def new_game():
+        # Own hint engine, so hints are searched rather than read from the shared cache
+        game = SudokuGame(difficulty="hard", hint_engine=HintEngine())
+        game.board = board.copy()
+        return game
+
+    def cached_game():
+        game = new_game()
+        game.peek_hint()
+        return game
+
+    def one_cell_left():
+        # Worst case for a completion check: everything filled but one cell
+        game = new_game()
+        for i in list(game.board.empty_cells)[1:]:
+            row, col = divmod(i, 9)
+            game.board.set_cell(row, col, game.board.solution[i])
+        return game
+
+    def is_completed_1000(game):
+        for _ in range(1000):
+            game.is_completed()
+
+    def hints_until_solved(game):
+        while game.get_hint():
+            pass
+
+    yield "game/is_completed x1000", is_completed_1000, one_cell_left, 1
+    yield "game/get_hint", SudokuGame.get_hint, new_game, 1
+    yield "game/peek_hint cached", SudokuGame.peek_hint, cached_game, 1
+    yield "game/get_hint until solved", hints_until_solved, new_game, 0.5
+
+
+GROUPS = {
+    "solve": solve_cases,
+    "generate": generate_cases,
+    "validate": validation_cases,
+    "edit": edit_cases,
+    "game": game_cases,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the solver, generator and game hot paths.")
+    parser.add_argument("--repeat", type=int, default=30, help="timed runs per case (fewer for the slow ones)")
+    parser.add_argument("--only", nargs="+", choices=list(GROUPS), help="run only these groups")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="allowed slowdown / extra allocation over the baseline (0.5 = 50%%)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    results = {}
+
+    print(f"{'case':<36} {'runs':>5} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9} {'peak KiB':>9}")
+    for group in args.only or GROUPS:
+        for name, func, setup, scale in GROUPS[group](args.seed):
+            allocations = measure_allocations(func, setup)  # Also warms up caches before timing
+            stats = summarize(time_call(func, repeat=max(1, round(args.repeat * scale)), setup=setup))
+            stats.update(allocations)
+            results[name] = stats
+            print(f"{name:<36} {stats['runs']:>5} {stats['p50_ms']:>7.2f}ms {stats['p95_ms']:>7.2f}ms "
+                  f"{stats['p99_ms']:>7.2f}ms {stats['max_ms']:>7.2f}ms {stats['peak_kib']:>9.1f}")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if args.output:
+        write_json(args.output, report)
+    if args.save_baseline:
+        write_json(args.baseline, report)
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}, nothing to compare (use --save-baseline)")
+        return
+    baseline = read_json(args.baseline)["results"]
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if not regressions:
+        print(f"\nNo regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+        return
+    print(f"\nRegressions against {args.baseline} (tolerance {args.tolerance:.0%}):")
+    for case, metric, old, new in regressions:
+        print(f"  {case:<36} {metric:<9} {old:>9.2f} -> {new:>9.2f}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
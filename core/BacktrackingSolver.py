@@ -0,0 +1,90 @@
+from core.GridGeometry import GridGeometry
+from core.SolverBackend import SolverBackend
+
+
+class BacktrackingSolver(SolverBackend):
+    # The original SudokuBoard solver: recursion over cells in column-major order,
+    # validating every candidate by scanning its row, column and box
+    name = "backtracking"
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        self.grid = None
+        self.geometry = None
+        self.limit = 1
+        self.found = 0
+
+    def solve(self, grid, budget=None):
+        self.grid = grid
+        self.geometry = GridGeometry.of_grid(grid)
+        self._start(budget, 1)
+        if not self._givens_valid():
+            return False
+        original = [list(row) for row in grid] if budget else None
+        solved = self._search(0, 0, self.rng)
+        if self.status:
+            for row, values in zip(grid, original):
+                row[:] = values  # Stopped midway: undo the partial fill
+            return False
+        return solved
+
+    def count_solutions(self, grid, limit=2, budget=None):
+        self.grid = [list(row) for row in grid]
+        self.geometry = GridGeometry.of_grid(grid)
+        self._start(budget, limit)
+        if not self._givens_valid():
+            return 0
+        self._search(0, 0, None)
+        return self.found
+
+    def _givens_valid(self):
+        # A digit repeated in a row, column or box means no solution. The search only validates the
+        # digits it places, so such givens are rejected before searching
+        cells = [value for row in self.grid for value in row]
+        for unit in self.geometry.units:
+            values = [cells[i] for i in unit if cells[i]]
+            if len(values) != len(set(values)):
+                return False
+        return True
+
+    def _search(self, i, j, rng):
+        # Returns True when done: `limit` solutions found or the budget ran out (status set)
+        self.nodes += 1
+        if self.budget and self._exhausted():
+            return True
+        size = self.geometry.size
+        if i == size:
+            i, j = 0, j + 1
+            if j == size:
+                # Fully solved: stop, or backtrack to look for further solutions
+                self.found += 1
+                return self.found >= self.limit
+
+        grid = self.grid
+        if grid[i][j] != 0:
+            return self._search(i + 1, j, rng)  # Move to next cell
+
+        numbers = rng.sample(range(1, size + 1), size) if rng else range(1, size + 1)
+        for num in numbers:
+            if self._is_valid(num, i, j):
+                grid[i][j] = num
+                if self._search(i + 1, j, rng):
+                    return True
+                grid[i][j] = 0  # Backtrack
+
+        return False  # No valid number found
+
+    def _is_valid(self, num, row, col):
+        grid = self.grid
+        size, box = self.geometry.size, self.geometry.box_size
+        if any(grid[row][i] == num for i in range(size) if i != col):
+            return False
+        if any(grid[i][col] == num for i in range(size) if i != row):
+            return False
+
+        box_x, box_y = col // box, row // box
+        for i in range(box_y * box, box_y * box + box):
+            for j in range(box_x * box, box_x * box + box):
+                if grid[i][j] == num and (i, j) != (row, col):
+                    return False
+        return True
@@ -0,0 +1,183 @@
+from core.GridGeometry import GridGeometry
+from core.SolverBackend import SolverBackend
+
+
+class BitmaskSolver(SolverBackend):
+    # Keeps row/column/box digit masks, propagates naked and hidden singles and branches on the
+    # most constrained cell (MRV)
+    name = "bitmask"
+
+    # Hidden-single passes cost more than they save on 9x9 grids, but keep larger ones from branching
+    HIDDEN_SINGLES_MIN_SIZE = 16
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        self.order_rng = None  # Only shuffle candidates when filling a grid, not when counting
+        self.geometry = None  # Tables of the grid size being solved, set by _load
+        self.cells = []
+        self.rows = []
+        self.cols = []
+        self.boxes = []
+        self.limit = 1  # Stop searching once this many solutions were found
+        self.found = 0
+
+    def solve(self, grid, budget=None):
+        # Solve an N x N list-of-lists grid in place, returns False if it has no solution
+        self._start(budget, 1)
+        self.order_rng = self.rng
+        if not self._load(grid):
+            return False
+        if not self._search() or self.status:
+            return False
+
+        cells, size = self.cells, self.geometry.size
+        for row in range(size):
+            grid[row][:] = cells[row * size:row * size + size]
+        return True
+
+    def count_solutions(self, grid, limit=2, budget=None):
+        # Count the solutions of a grid without modifying it, stopping as soon as `limit` are found
+        self._start(budget, limit)
+        self.order_rng = None
+        if not self._load(grid):
+            return 0
+        self._search()
+        return self.found
+
+    def _load(self, grid):
+        # Build the row/column/box digit masks from the givens, rejecting duplicates
+        geometry = self.geometry
+        if geometry is None or geometry.size != len(grid):
+            geometry = self.geometry = GridGeometry.of_grid(grid)
+        size = geometry.size
+        self.cells = cells = [value for row in grid for value in row]
+        self.rows, self.cols, self.boxes = rows, cols, boxes = [0] * size, [0] * size, [0] * size
+
+        for i, value in enumerate(cells):
+            if value:
+                bit = 1 << value
+                r, c, b = geometry.row_of[i], geometry.col_of[i], geometry.box_of[i]
+                if (rows[r] | cols[c] | boxes[b]) & bit:
+                    return False
+                rows[r] |= bit
+                cols[c] |= bit
+                boxes[b] |= bit
+        return True
+
+    def _place(self, i, bit, trail):
+        geometry = self.geometry
+        self.cells[i] = bit.bit_length() - 1
+        self.rows[geometry.row_of[i]] |= bit
+        self.cols[geometry.col_of[i]] |= bit
+        self.boxes[geometry.box_of[i]] |= bit
+        trail.append(i)
+
+    def _unplace(self, i):
+        geometry = self.geometry
+        bit = ~(1 << self.cells[i])
+        self.cells[i] = 0
+        self.rows[geometry.row_of[i]] &= bit
+        self.cols[geometry.col_of[i]] &= bit
+        self.boxes[geometry.box_of[i]] &= bit
+
+    def _undo(self, trail):
+        # Clear every cell placed since the trail was started
+        for i in trail:
+            self._unplace(i)
+        trail.clear()
+
+    def _hidden_singles(self, trail):
+        # Place every digit that fits a single cell of its unit. Returns the number of cells placed,
+        # or None if some unit has a digit with nowhere left to go
+        geometry = self.geometry
+        cells, rows, cols, boxes = self.cells, self.rows, self.cols, self.boxes
+        row_of, col_of, box_of, all_digits = geometry.row_of, geometry.col_of, geometry.box_of, geometry.all_digits
+        placed = 0
+        for unit in geometry.units:
+            once = twice = done = 0
+            for i in unit:
+                if cells[i]:
+                    done |= 1 << cells[i]
+                    continue
+                mask = ~(rows[row_of[i]] | cols[col_of[i]] | boxes[box_of[i]]) & all_digits
+                twice |= once & mask
+                once |= mask
+            if once | done != all_digits:
+                return None
+
+            single = once & ~twice & ~done
+            while single:
+                bit = single & -single
+                single ^= bit
+                # The cell may have been taken by an earlier placement of this pass; the next pass
+                # then reports the digit as having no place
+                for i in unit:
+                    if not cells[i] and not (rows[row_of[i]] | cols[col_of[i]] | boxes[box_of[i]]) & bit:
+                        self._place(i, bit, trail)
+                        placed += 1
+                        break
+        return placed
+
+    def _search(self):
+        # Returns True when done: `limit` solutions found or the budget ran out (status set)
+        self.nodes += 1
+        if self.budget and self._exhausted():
+            return True
+        cells, rows, cols, boxes = self.cells, self.rows, self.cols, self.boxes
+        geometry = self.geometry
+        row_of, col_of, box_of, all_digits = geometry.row_of, geometry.col_of, geometry.box_of, geometry.all_digits
+        trail = []
+
+        # Single propagation: keep placing forced cells until none are left, remembering the most
+        # constrained cell of the last (stable) pass
+        hidden_singles = geometry.size >= self.HIDDEN_SINGLES_MIN_SIZE
+        while True:
+            progress = False
+            best, best_mask, best_count = -1, 0, geometry.size + 1
+            for i, value in enumerate(cells):
+                if value:
+                    continue
+                mask = ~(rows[row_of[i]] | cols[col_of[i]] | boxes[box_of[i]]) & all_digits
+                if not mask:
+                    self._undo(trail)  # Dead end: an empty cell has no candidates
+                    return False
+                if not mask & (mask - 1):
+                    self._place(i, mask, trail)
+                    progress = True
+                elif mask.bit_count() < best_count:
+                    best, best_mask, best_count = i, mask, mask.bit_count()
+            if not progress and best != -1 and hidden_singles:
+                placed = self._hidden_singles(trail)
+                if placed is None:
+                    self._undo(trail)  # Dead end: a digit has no place left in some unit
+                    return False
+                progress = placed > 0
+            if not progress:
+                break
+
+        if best == -1:
+            # No empty cells left: stop here, or backtrack to look for further solutions
+            self.found += 1
+            if self.found >= self.limit:
+                return True
+            self._undo(trail)
+            return False
+
+        # Branch on the cell with the fewest candidates (MRV)
+        bits = []
+        while best_mask:
+            bit = best_mask & -best_mask
+            bits.append(bit)
+            best_mask ^= bit
+        if self.order_rng:
+            self.order_rng.shuffle(bits)
+
+        for bit in bits:
+            self._place(best, bit, trail)
+            if self._search():
+                return True
+            trail.pop()
+            self._unplace(best)
+
+        self._undo(trail)
+        return False
@@ -0,0 +1,211 @@
+from core.GridGeometry import GridGeometry
+from core.SolverBackend import SolverBackend
+
+# Node arrays of one dancing-links matrix, swapped in as a whole when the grid size changes
+MATRIX_FIELDS = ("left", "right", "up", "down", "column", "sizes", "row_id", "row_start", "column_count")
+
+
+class DLXSolver(SolverBackend):
+    # Knuth's Algorithm X on a dancing-links matrix. For an N x N grid there are N^3 candidate rows
+    # (cell, digit) over 4 * N^2 constraint columns: one per cell, then one per (row, digit),
+    # (column, digit) and (box, digit). Node 0 is the root, the next 4 * N^2 nodes are the column headers
+    name = "dlx"
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        self.order_rng = None
+        self.limit = 1
+        self.found = 0
+        self.solution = []
+        self.geometry = None
+        self._matrices = {}  # Built matrix per box size
+        self._use(GridGeometry.of(3))
+
+    def _use(self, geometry):
+        # Switch to the matrix of the given grid size, building it on first use
+        if geometry is self.geometry:
+            return
+        if geometry.box_size not in self._matrices:
+            self._build(geometry)
+            self._matrices[geometry.box_size] = tuple(getattr(self, field) for field in MATRIX_FIELDS)
+        for field, value in zip(MATRIX_FIELDS, self._matrices[geometry.box_size]):
+            setattr(self, field, value)
+        self.geometry = geometry
+
+    def _build(self, geometry):
+        # The matrix is built once per size; every search restores it completely by uncovering
+        n, cell_count = geometry.size, geometry.cell_count
+        self.column_count = 4 * cell_count
+        size = self.column_count + 1
+        self.left = [i - 1 for i in range(size)]
+        self.right = [i + 1 for i in range(size)]
+        self.left[0], self.right[-1] = self.column_count, 0
+        self.up = list(range(size))
+        self.down = list(range(size))
+        self.column = list(range(size))
+        self.sizes = [0] * size
+        self.row_id = [-1] * size
+        self.row_start = []  # First node of each candidate row
+
+        for cell in range(cell_count):
+            row, col, box = geometry.row_of[cell], geometry.col_of[cell], geometry.box_of[cell]
+            for digit in range(n):
+                columns = (
+                    cell,
+                    cell_count + row * n + digit,
+                    2 * cell_count + col * n + digit,
+                    3 * cell_count + box * n + digit,
+                )
+                self.row_start.append(len(self.column))
+                self._add_row(cell * n + digit, [c + 1 for c in columns])
+
+    def _add_row(self, row_id, headers):
+        first = len(self.column)
+        for offset, header in enumerate(headers):
+            node = first + offset
+            # Link vertically at the bottom of the column
+            self.up.append(self.up[header])
+            self.down.append(header)
+            self.down[self.up[header]] = node
+            self.up[header] = node
+            # Link horizontally in a circular row
+            self.left.append(first + (offset - 1) % len(headers))
+            self.right.append(first + (offset + 1) % len(headers))
+            self.column.append(header)
+            self.row_id.append(row_id)
+            self.sizes.append(0)
+            self.sizes[header] += 1
+
+    def _cover(self, header):
+        left, right, up, down, column, sizes = (
+            self.left, self.right, self.up, self.down, self.column, self.sizes)
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                sizes[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, header):
+        left, right, up, down, column, sizes = (
+            self.left, self.right, self.up, self.down, self.column, self.sizes)
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                sizes[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def _select_givens(self, grid):
+        # Cover the columns of every given, returns the selected rows or None on a conflict
+        used = set()
+        selected = []
+        n = self.geometry.size
+        for cell in range(self.geometry.cell_count):
+            value = grid[cell // n][cell % n]
+            if not value:
+                continue
+            node = self.row_start[cell * n + value - 1]
+            headers = [self.column[node + k] for k in range(4)]
+            if used.intersection(headers):
+                self._release_givens(selected)
+                return None
+            used.update(headers)
+            for header in headers:
+                self._cover(header)
+            selected.append(node)
+        return selected
+
+    def _release_givens(self, selected):
+        for node in reversed(selected):
+            for k in range(3, -1, -1):
+                self._uncover(self.column[node + k])
+
+    def _run(self, grid):
+        self._use(GridGeometry.of_grid(grid))
+        selected = self._select_givens(grid)
+        if selected is None:
+            return False
+        self.solution = []
+        self._search([])
+        self._release_givens(selected)
+        return True
+
+    def solve(self, grid, budget=None):
+        self._start(budget, 1)
+        self.order_rng = self.rng
+        if not self._run(grid) or not self.found or self.status:
+            return False
+        n = self.geometry.size
+        for row_id in self.solution:
+            cell, digit = divmod(row_id, n)
+            grid[cell // n][cell % n] = digit + 1
+        return True
+
+    def count_solutions(self, grid, limit=2, budget=None):
+        self._start(budget, limit)
+        self.order_rng = None
+        self._run(grid)
+        return self.found
+
+    def _search(self, partial):
+        # Returns True once `limit` solutions were found or the budget ran out (status set);
+        # the matrix is restored either way
+        self.nodes += 1
+        if self.budget and self._exhausted():
+            return True
+        right, down, sizes = self.right, self.down, self.sizes
+        if right[0] == 0:
+            if not self.found:
+                self.solution = list(partial)
+            self.found += 1
+            return self.found >= self.limit
+
+        # Choose the column with the fewest remaining rows
+        header, best = 0, self.column_count + 1
+        c = right[0]
+        while c != 0:
+            if sizes[c] < best:
+                header, best = c, sizes[c]
+                if best <= 1:
+                    break
+            c = right[c]
+        if best == 0:
+            return False
+
+        self._cover(header)
+        rows = []
+        node = down[header]
+        while node != header:
+            rows.append(node)
+            node = down[node]
+        if self.order_rng:
+            self.order_rng.shuffle(rows)
+
+        done = False
+        for node in rows:
+            partial.append(self.row_id[node])
+            j = right[node]
+            while j != node:
+                self._cover(self.column[j])
+                j = right[j]
+            done = self._search(partial)
+            j = self.left[node]
+            while j != node:
+                self._uncover(self.column[j])
+                j = self.left[j]
+            partial.pop()
+            if done:
+                break
+        self._uncover(header)
+        return done
@@ -0,0 +1,54 @@
+import threading
+from collections import OrderedDict
+from core.LogicalSolver import LogicalSolver
+
+# Hardest technique level (see LogicalSolver.TECHNIQUE_LEVELS) allowed per difficulty
+DIFFICULTY_BANDS = {
+    "easy": (1, 2),  # Singles only
+    "medium": (3, 3),  # Locked candidates
+    "hard": (4, 5),  # Pairs and triples
+    "advanced": (6, 8),  # Fish, wings or guessing
+}
+
+
+class DifficultyRater:
+    def __init__(self, cache_size=10000):
+        # Ratings memoized by the exact board contents, least recently used evicted first
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()  # Shared by the puzzle pool worker threads
+
+    def rate(self, grid):
+        # Returns {"level", "technique", "difficulty"} for the hardest technique the puzzle needs,
+        # or None for a contradictory grid
+        key = bytes(value for row in grid for value in row)
+        with self._lock:
+            if key in self.cache:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                return self.cache[key]
+            self.misses += 1
+
+        result = LogicalSolver(grid).solve()
+        rating = None
+        if result:
+            level, technique = result
+            rating = {"level": level, "technique": technique, "difficulty": self.difficulty_for(level)}
+
+        with self._lock:
+            self.cache[key] = rating
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return rating
+
+    @staticmethod
+    def difficulty_for(level):
+        for difficulty, (low, high) in DIFFICULTY_BANDS.items():
+            if low <= level <= high:
+                return difficulty
+        return "easy"  # Level 0: nothing left to solve
+
+    def get_stats(self):
+        return {"size": len(self.cache), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,52 @@
+MIN_BOX_SIZE = 2
+MAX_BOX_SIZE = 5
+
+# Symbol shown (and typed) for each value: digits first, then letters for values above 9
+SYMBOLS = "123456789ABCDEFGHIJKLMNOP"
+
+
+class GridGeometry:
+    # Lookup tables of an N x N grid with box_size x box_size boxes (N = box_size ** 2),
+    # stored as a flat sequence (cell index = row * N + col)
+    _cache = {}
+
+    def __init__(self, box_size):
+        if not MIN_BOX_SIZE <= box_size <= MAX_BOX_SIZE:
+            raise ValueError(f"Unsupported box size: {box_size} (expected {MIN_BOX_SIZE}-{MAX_BOX_SIZE})")
+        self.box_size = box_size
+        self.size = size = box_size * box_size
+        self.cell_count = size * size
+        self.all_digits = ((1 << size) - 1) << 1  # Digit d is stored as bit (1 << d)
+
+        self.row_of = [i // size for i in range(self.cell_count)]
+        self.col_of = [i % size for i in range(self.cell_count)]
+        self.box_of = [(i // size // box_size) * box_size + (i % size) // box_size for i in range(self.cell_count)]
+
+        # Units 0..N-1 are rows, N..2N-1 columns and 2N..3N-1 boxes
+        self.units = (
+            [[row * size + col for col in range(size)] for row in range(size)]
+            + [[row * size + col for row in range(size)] for col in range(size)]
+            + [[i for i in range(self.cell_count) if self.box_of[i] == box] for box in range(size)]
+        )
+        self.cell_units = [(self.row_of[i], size + self.col_of[i], 2 * size + self.box_of[i])
+                           for i in range(self.cell_count)]
+
+    @classmethod
+    def of(cls, box_size):
+        # Shared instance per box size, the tables never change
+        if box_size not in cls._cache:
+            cls._cache[box_size] = cls(box_size)
+        return cls._cache[box_size]
+
+    @classmethod
+    def of_grid(cls, grid):
+        # Geometry of an N x N grid (lists of lists or board views)
+        box_size = int(len(grid) ** 0.5)
+        if box_size * box_size != len(grid):
+            raise ValueError(f"Not a square-box grid: {len(grid)} rows")
+        return cls.of(box_size)
+
+
+def symbol(value):
+    # Text for a cell value, "" for an empty cell
+    return SYMBOLS[value - 1] if value else ""
@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from core.LogicalSolver import TECHNIQUE_LEVELS, LogicalSolver, unit_name
+
+# A cell to fill, the technique proving it (hardest step needed on the way) and a readable reason
+Hint = namedtuple("Hint", ["row", "col", "digit", "technique", "level", "reason"])
+
+
+class HintEngine:
+    def __init__(self, cache_size=1000, budget_ms=10):
+        # Next logical step for a board state, memoized by the board contents (least recently used
+        # evicted first), so asking again or highlighting the hint every frame is a dict lookup.
+        # The search stops after budget_ms and falls back to revealing a cell from the solution
+        self.cache = OrderedDict()
+        self.cache_size = cache_size
+        self.budget = budget_ms / 1000
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def next_hint(self, board):
+        # The easiest deducible empty cell of a SudokuBoard, or None when the board is full
+        key = bytes(board.cells) + bytes(board.solution)
+        with self._lock:
+            if key in self.cache:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                return self.cache[key]
+            self.misses += 1
+
+        hint = None
+        if board.empty_cells:
+            deadline = time.perf_counter() + self.budget
+            if board.size == 9:
+                hint = self._logical_hint(board, deadline)
+            else:
+                hint = self._single_hint(board, deadline)
+            if hint is None:
+                hint = self._revealed_hint(board)
+
+        with self._lock:
+            self.cache[key] = hint
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return hint
+
+    def _logical_hint(self, board, deadline):
+        # Apply LogicalSolver steps until one places a digit in an empty cell. Entries that differ from
+        # the solution are left out, so a player's mistake never leads to a wrong deduction; a step
+        # filling such a cell is only applied, the hint never overwrites what the player typed
+        cells = [value if value == board.solution[i] else 0 for i, value in enumerate(board.cells)]
+        solver = LogicalSolver([cells[row * 9:row * 9 + 9] for row in range(9)])
+        needed = []  # Elimination steps the placement depends on
+        while time.perf_counter() < deadline:
+            step = solver.find_step()
+            if step is None:
+                return None  # Stuck: needs trial and error
+            for cell, digit in step.placements:
+                if board.cells[cell] == 0:
+                    return self._make_hint(board, cell, digit, step, needed)
+            if not solver.apply(step):
+                return None
+            needed.append(step)
+        return None
+
+    def _make_hint(self, board, cell, digit, step, needed):
+        row, col = divmod(cell, board.size)
+        if step.unit is not None:
+            reason = f"{step.technique} in {unit_name(step.unit)}"
+        else:
+            reason = f"{step.technique} at row {row + 1}, column {col + 1}"
+        techniques = list(dict.fromkeys(previous.technique for previous in needed))
+        if techniques:
+            reason += f" (after {', '.join(techniques)})"
+        level = max([step.level] + [previous.level for previous in needed])
+        return Hint(row, col, digit, step.technique, level, reason)
+
+    def _single_hint(self, board, deadline):
+        # Boards other than 9x9: naked singles from the board's candidate masks, then hidden singles
+        size = board.size
+        for i in board.empty_cells:
+            row, col = divmod(i, size)
+            candidates = board.get_candidates(row, col)
+            if len(candidates) == 1 and candidates[0] == board.solution[i]:
+                return Hint(row, col, candidates[0], "naked single", TECHNIQUE_LEVELS["naked single"],
+                            f"naked single at row {row + 1}, column {col + 1}")
+
+        empty = set(board.empty_cells)
+        for unit, unit_cells in enumerate(board.geometry.units):
+            if time.perf_counter() > deadline:
+                return None
+            open_cells = [i for i in unit_cells if i in empty]
+            if not open_cells:
+                continue
+            places = {}
+            for i in open_cells:
+                for digit in board.get_candidates(*divmod(i, size)):
+                    places.setdefault(digit, []).append(i)
+            for digit, where in places.items():
+                if len(where) == 1 and board.solution[where[0]] == digit:
+                    row, col = divmod(where[0], size)
+                    kind = ("row", "column", "box")[unit // size]
+                    return Hint(row, col, digit, "hidden single", TECHNIQUE_LEVELS["hidden single"],
+                                f"hidden single in {kind} {unit % size + 1}")
+        return None
+
+    def _revealed_hint(self, board):
+        # No deduction found (or out of time): reveal the most constrained empty cell from the solution
+        size = board.size
+        cell = min(board.empty_cells, key=lambda i: len(board.get_candidates(*divmod(i, size))))
+        row, col = divmod(cell, size)
+        return Hint(row, col, board.solution[cell], "trial and error", TECHNIQUE_LEVELS["trial and error"],
+                    f"no logical step found, revealed row {row + 1}, column {col + 1}")
+
+    def get_stats(self):
+        return {"size": len(self.cache), "hits": self.hits, "misses": self.misses}
@@ -30,13 +30,13 @@ class HowToPlay:
         instructions = [
             "• Fill every row, column, and 3×3 box with 1–9",
             "• Click a cell to select it",
-            "• Type 1–9 to place numbers",
+            "• Type 1–9 to place numbers (Shift + A–P for 10+)",
             "• Backspace/Delete to erase",
             "• Press H or click Hint to reveal a cell (no points)",
-            "• Press C to clear your inputs",
+            "• Press C to clear your inputs, Ctrl+Z / Ctrl+Y to undo / redo",
             "• Earn 1 point per correct move",
             "• Level up every 100 points",
-            "• Choose difficulty: Easy -> Advanced",
+            "• Choose difficulty and board size (4×4 to 25×25)",
             "• Press ESC or click below to go back"
         ]
 
@@ -0,0 +1,251 @@
+from collections import namedtuple
+from itertools import combinations, islice
+
+# Cell index = row * 9 + col. Units 0-8 are rows, 9-17 columns and 18-26 boxes
+ROWS = [[row * 9 + col for col in range(9)] for row in range(9)]
+COLS = [[row * 9 + col for row in range(9)] for col in range(9)]
+BOXES = [[(box // 3 * 3 + k // 3) * 9 + box % 3 * 3 + k % 3 for k in range(9)] for box in range(9)]
+UNITS = ROWS + COLS + BOXES
+CELL_UNITS = [[u for u, unit in enumerate(UNITS) if i in unit] for i in range(81)]
+PEERS = [sorted({j for u in CELL_UNITS[i] for j in UNITS[u]} - {i}) for i in range(81)]
+
+ALL_DIGITS = 0b1111111110
+POPCOUNT = [bin(mask).count("1") for mask in range(1 << 10)]
+
+# Techniques from easiest to hardest with their difficulty level
+TECHNIQUE_LEVELS = {
+    "hidden single": 1,
+    "naked single": 2,
+    "pointing": 3,
+    "claiming": 3,
+    "naked pair": 4,
+    "hidden pair": 4,
+    "naked triple": 5,
+    "hidden triple": 5,
+    "x-wing": 6,
+    "swordfish": 7,
+    "xy-wing": 7,
+    "trial and error": 8,  # No technique applies: the puzzle needs guessing
+}
+
+# placements: [(cell, digit)], eliminations: [(cell, digit mask)], unit: the unit the deduction is based on
+Step = namedtuple("Step", ["technique", "level", "placements", "eliminations", "unit"])
+
+
+def unit_name(unit):
+    # Human readable unit, e.g. "row 4" (1-based like the board labels)
+    kind = ("row", "column", "box")[unit // 9]
+    return f"{kind} {unit % 9 + 1}"
+
+
+def digits_of(mask):
+    return [digit for digit in range(1, 10) if mask >> digit & 1]
+
+
+class LogicalSolver:
+    def __init__(self, grid):
+        # Solve like a human: keep pencil-mark candidates and apply graded techniques
+        self.cells = [value for row in grid for value in row]
+        self.candidates = [0] * 81
+        for i in range(81):
+            if not self.cells[i]:
+                used = 0
+                for peer in PEERS[i]:
+                    used |= 1 << self.cells[peer]
+                self.candidates[i] = ALL_DIGITS & ~used
+
+        # (finder, apply every step it finds at once); only singles are safe to batch
+        self.finders = [
+            (self._hidden_singles, True),
+            (self._naked_singles, True),
+            (self._locked_candidates, False),
+            (lambda: self._naked_subsets(2), False),
+            (lambda: self._hidden_subsets(2), False),
+            (lambda: self._naked_subsets(3), False),
+            (lambda: self._hidden_subsets(3), False),
+            (lambda: self._fish(2), False),
+            (lambda: self._fish(3), False),
+            (self._xy_wings, False),
+        ]
+
+    def is_solved(self):
+        return all(self.cells)
+
+    def find_step(self):
+        # The easiest deduction available in the current state, or None when stuck
+        for finder, _ in self.finders:
+            step = next(finder(), None)
+            if step:
+                return step
+        return None
+
+    def place(self, cell, digit):
+        bit = 1 << digit
+        self.cells[cell] = digit
+        self.candidates[cell] = 0
+        for peer in PEERS[cell]:
+            self.candidates[peer] &= ~bit
+
+    def apply(self, step):
+        # Apply a step, returns False if it contradicts the current state
+        for cell, digit in step.placements:
+            if self.cells[cell]:
+                if self.cells[cell] != digit:
+                    return False
+                continue
+            if not self.candidates[cell] >> digit & 1:
+                return False
+            self.place(cell, digit)
+        for cell, mask in step.eliminations:
+            self.candidates[cell] &= ~mask
+            if not self.cells[cell] and not self.candidates[cell]:
+                return False
+        return True
+
+    def solve(self):
+        # Apply the easiest technique until solved or stuck. Returns (level, technique) of the hardest
+        # technique needed, "trial and error" when logic alone is not enough, or None if contradictory
+        hardest = (0, None)
+        while not self.is_solved():
+            for finder, batch in self.finders:
+                steps = list(finder()) if batch else list(islice(finder(), 1))
+                if steps:
+                    break
+            else:
+                return TECHNIQUE_LEVELS["trial and error"], "trial and error"
+
+            for step in steps:
+                if not self.apply(step):
+                    return None
+            hardest = max(hardest, (steps[0].level, steps[0].technique))
+        return hardest
+
+    # --- Techniques (generators yielding every applicable step) ---
+
+    def _hidden_singles(self):
+        cells, candidates = self.cells, self.candidates
+        for u, unit in enumerate(UNITS):
+            placed = 0
+            for i in unit:
+                placed |= 1 << cells[i]
+            for digit in range(1, 10):
+                if placed >> digit & 1:
+                    continue
+                where = [i for i in unit if candidates[i] >> digit & 1]
+                if len(where) == 1:
+                    yield Step("hidden single", 1, [(where[0], digit)], [], u)
+
+    def _naked_singles(self):
+        for i, mask in enumerate(self.candidates):
+            if mask and not mask & (mask - 1):
+                yield Step("naked single", 2, [(i, mask.bit_length() - 1)], [], None)
+
+    def _locked_candidates(self):
+        candidates = self.candidates
+        for u, unit in enumerate(UNITS):
+            for digit in range(1, 10):
+                bit = 1 << digit
+                where = [i for i in unit if candidates[i] & bit]
+                if len(where) < 2:
+                    continue
+                if u >= 18:
+                    # Pointing: inside a box the digit is confined to one row or column
+                    technique = "pointing"
+                    lines = {CELL_UNITS[i][0] for i in where}, {CELL_UNITS[i][1] for i in where}
+                else:
+                    # Claiming: inside a row or column the digit is confined to one box
+                    technique = "claiming"
+                    lines = ({CELL_UNITS[i][2] for i in where},)
+                for line in lines:
+                    if len(line) != 1:
+                        continue
+                    other = UNITS[line.pop()]
+                    eliminations = [(j, bit) for j in other if j not in unit and candidates[j] & bit]
+                    if eliminations:
+                        yield Step(technique, 3, [], eliminations, u)
+
+    def _naked_subsets(self, size):
+        candidates = self.candidates
+        technique = "naked pair" if size == 2 else "naked triple"
+        for u, unit in enumerate(UNITS):
+            open_cells = [i for i in unit if candidates[i] and POPCOUNT[candidates[i]] <= size]
+            for subset in combinations(open_cells, size):
+                union = 0
+                for i in subset:
+                    union |= candidates[i]
+                if POPCOUNT[union] != size:
+                    continue
+                eliminations = [(j, candidates[j] & union) for j in unit
+                                if j not in subset and candidates[j] & union]
+                if eliminations:
+                    yield Step(technique, TECHNIQUE_LEVELS[technique], [], eliminations, u)
+
+    def _hidden_subsets(self, size):
+        cells, candidates = self.cells, self.candidates
+        technique = "hidden pair" if size == 2 else "hidden triple"
+        for u, unit in enumerate(UNITS):
+            placed = 0
+            for i in unit:
+                placed |= 1 << cells[i]
+            # Bitmask of unit positions (0-8) where each unplaced digit can still go
+            positions = {}
+            for digit in range(1, 10):
+                if not placed >> digit & 1:
+                    where = sum(1 << k for k, i in enumerate(unit) if candidates[i] >> digit & 1)
+                    if 2 <= POPCOUNT[where] <= size:
+                        positions[digit] = where
+            for digits in combinations(positions, size):
+                where = 0
+                for digit in digits:
+                    where |= positions[digit]
+                if POPCOUNT[where] != size:
+                    continue
+                keep = sum(1 << digit for digit in digits)
+                eliminations = [(unit[k], candidates[unit[k]] & ~keep) for k in range(9)
+                                if where >> k & 1 and candidates[unit[k]] & ~keep]
+                if eliminations:
+                    yield Step(technique, TECHNIQUE_LEVELS[technique], [], eliminations, u)
+
+    def _fish(self, size):
+        # X-Wing (size 2) / Swordfish (size 3): a digit confined to the same `size` columns in
+        # `size` rows (or vice versa) can be removed from the rest of those columns
+        candidates = self.candidates
+        technique = "x-wing" if size == 2 else "swordfish"
+        for digit in range(1, 10):
+            bit = 1 << digit
+            for base, cover in ((ROWS, COLS), (COLS, ROWS)):
+                lines = {}
+                for index, line in enumerate(base):
+                    where = sum(1 << k for k, i in enumerate(line) if candidates[i] & bit)
+                    if 2 <= POPCOUNT[where] <= size:
+                        lines[index] = where
+                for chosen in combinations(lines, size):
+                    where = 0
+                    for index in chosen:
+                        where |= lines[index]
+                    if POPCOUNT[where] != size:
+                        continue
+                    eliminations = [(i, bit) for k in range(9) if where >> k & 1
+                                    for index, i in enumerate(cover[k])
+                                    if index not in chosen and candidates[i] & bit]
+                    if eliminations:
+                        yield Step(technique, TECHNIQUE_LEVELS[technique], [], eliminations, None)
+
+    def _xy_wings(self):
+        # Pivot {x, y} sees pincers {x, z} and {y, z}: z can go from every cell seeing both pincers
+        candidates = self.candidates
+        for pivot in range(81):
+            mask = candidates[pivot]
+            if POPCOUNT[mask] != 2:
+                continue
+            pincers = [i for i in PEERS[pivot] if POPCOUNT[candidates[i]] == 2
+                       and POPCOUNT[candidates[i] & mask] == 1]
+            for a, b in combinations(pincers, 2):
+                shared_a, shared_b = candidates[a] & mask, candidates[b] & mask
+                z = candidates[a] & ~mask
+                if shared_a == shared_b or z != candidates[b] & ~mask:
+                    continue
+                seen_by_b = set(PEERS[b])
+                eliminations = [(i, z) for i in PEERS[a] if i in seen_by_b and i != pivot and candidates[i] & z]
+                if eliminations:
+                    yield Step("xy-wing", 7, [], eliminations, None)
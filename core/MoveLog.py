@@ -0,0 +1,120 @@
+import struct
+import time
+from array import array
+
+# What caused a change (stored as one byte per delta)
+KINDS = ("input", "delete", "hint", "clear")
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+# Serialized form: header (magic, version, step count, delta count, position), the start of every
+# step, then one packed record per delta
+MAGIC = b"DKML"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBIII")
+DELTA = struct.Struct("<HBBBI")  # cell, old, new, kind, milliseconds since the log started
+
+
+class MoveLog:
+    def __init__(self, clock=time.monotonic):
+        # Undo/redo history as deltas (cell, old value, new value, time, kind) in flat typed arrays,
+        # never as board snapshots. A step groups the deltas of one action (a whole clear_board
+        # is one step), so undo/redo costs one set_cell per changed cell
+        self.clock = clock
+        self.started = clock()
+        self.cells = array("H")
+        self.old = bytearray()
+        self.new = bytearray()
+        self.kinds = bytearray()
+        self.times = array("L")  # Milliseconds since the log started
+        self.steps = array("L")  # Index of the first delta of every step
+        self.position = 0  # Steps currently applied; steps after it can be redone
+
+    def __len__(self):
+        return len(self.steps)
+
+    def record(self, changes, kind):
+        # Add one step from [(cell, old, new)], dropping the steps that could still be redone
+        if not changes:
+            return
+        if self.position < len(self.steps):
+            end = self.steps[self.position]
+            del self.steps[self.position:]
+            del self.cells[end:], self.old[end:], self.new[end:], self.kinds[end:], self.times[end:]
+
+        elapsed = int((self.clock() - self.started) * 1000)
+        code = KIND_CODES[kind]
+        self.steps.append(len(self.cells))
+        for cell, old, new in changes:
+            self.cells.append(cell)
+            self.old.append(old)
+            self.new.append(new)
+            self.kinds.append(code)
+            self.times.append(elapsed)
+        self.position += 1
+
+    def can_undo(self):
+        return self.position > 0
+
+    def can_redo(self):
+        return self.position < len(self.steps)
+
+    def undo(self):
+        # [(cell, value to restore, kind)] of the last applied step, or None if there is none
+        if not self.can_undo():
+            return None
+        self.position -= 1
+        start, end = self._bounds(self.position)
+        return [(self.cells[i], self.old[i], KINDS[self.kinds[i]]) for i in range(end - 1, start - 1, -1)]
+
+    def redo(self):
+        # [(cell, value to set again, kind)] of the next undone step, or None if there is none
+        if not self.can_redo():
+            return None
+        start, end = self._bounds(self.position)
+        self.position += 1
+        return [(self.cells[i], self.new[i], KINDS[self.kinds[i]]) for i in range(start, end)]
+
+    def _bounds(self, step):
+        end = self.steps[step + 1] if step + 1 < len(self.steps) else len(self.cells)
+        return self.steps[step], end
+
+    def entries(self):
+        # Every delta as (cell, old, new, seconds since start, kind), e.g. to analyse a session
+        for i in range(len(self.cells)):
+            yield self.cells[i], self.old[i], self.new[i], self.times[i] / 1000, KINDS[self.kinds[i]]
+
+    def to_bytes(self):
+        # Compact binary form: 17-byte header, 4 bytes per step and 9 bytes per delta
+        data = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, len(self.steps), len(self.cells), self.position))
+        data += struct.pack(f"<{len(self.steps)}I", *self.steps)
+        for i in range(len(self.cells)):
+            data += DELTA.pack(self.cells[i], self.old[i], self.new[i], self.kinds[i], self.times[i])
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data, clock=time.monotonic):
+        # Rebuild a log written by to_bytes, raises ValueError for anything else
+        try:
+            magic, version, step_count, delta_count, position = HEADER.unpack_from(data)
+            offset = HEADER.size
+            steps = struct.unpack_from(f"<{step_count}I", data, offset)
+            offset += 4 * step_count
+            deltas = [DELTA.unpack_from(data, offset + DELTA.size * i) for i in range(delta_count)]
+        except struct.error:
+            raise ValueError("Truncated move log")
+        if magic != MAGIC or version != FORMAT_VERSION or position > step_count:
+            raise ValueError("Not a move log of this version")
+
+        log = cls(clock)
+        log.steps.extend(steps)
+        for cell, old, new, kind, elapsed in deltas:
+            log.cells.append(cell)
+            log.old.append(old)
+            log.new.append(new)
+            log.kinds.append(kind)
+            log.times.append(elapsed)
+        log.position = position
+        # Later deltas continue the recorded timeline
+        if deltas:
+            log.started -= deltas[-1][4] / 1000
+        return log
@@ -1,5 +1,8 @@
 from core.constants import *
 
+# Selectable box sizes: 4x4, 9x9, 16x16 and 25x25 boards
+BOX_SIZES = (2, 3, 4, 5)
+
 
 class PlayScreen:
     def __init__(self, screen, click_sound):
@@ -10,14 +13,16 @@ class PlayScreen:
         self.title_font = pygame.font.Font("assets/fonts/nunito_bold_italic.ttf", int(64 * 1.3))
         self.button_font = pygame.font.Font("assets/fonts/nunito_bold.ttf", int(32 * 1.3))
 
-        self.buttons = ["Easy", "Medium", "Hard", "Advanced", "Back to Menu"]
+        self.buttons = ["Easy", "Medium", "Hard", "Advanced", "Board Size", "Back to Menu"]
         self.button_rects = []
+        self.box_size = 3  # Board size used for the next game, cycled by the "Board Size" button
 
         self.button_colors = {
             "Easy": MUSTARD,
             "Medium": TIFFANY,
             "Hard": WATER,
             "Advanced": TARO,
+            "Board Size": CLOUDS,
             "Back to Menu": GRAY
         }
 
@@ -43,6 +48,9 @@ class PlayScreen:
             pygame.draw.rect(self.screen, bg_color, rect, border_radius=int(8 * 1.3))
             pygame.draw.rect(self.screen, BLACK, rect, 2, border_radius=int(8 * 1.3))
 
+            if text == "Board Size":
+                size = self.box_size * self.box_size
+                text = f"Board: {size}x{size}"
             text_surf = self.button_font.render(text, True, BLACK)
             text_rect = text_surf.get_rect(center=rect.center)
             self.screen.blit(text_surf, text_rect)
@@ -56,5 +64,8 @@ class PlayScreen:
                 text = self.buttons[index]
                 if text == "Back to Menu":
                     return "menu"
+                if text == "Board Size":
+                    self.box_size = BOX_SIZES[(BOX_SIZES.index(self.box_size) + 1) % len(BOX_SIZES)]
+                    return None
                 return text.lower()
         return None
\ No newline at end of file
@@ -0,0 +1,81 @@
+import json
+import os
+from core.SudokuBoard import SudokuBoard, parse_puzzle_id
+
+
+class PuzzleCache:
+    def __init__(self, directory="data/puzzle_cache", max_entries=500):
+        # On-disk LRU cache of seeded puzzles by puzzle ID (see SudokuBoard.puzzle_id), so asking for
+        # the same puzzle again (e.g. a shared challenge) skips generation. One small JSON file per
+        # puzzle; a hit touches its file and the least recently used files are evicted
+        self.directory = directory
+        self.max_entries = max_entries
+
+        # Counters for lookups answered from disk (hits) and lookups that had to generate (misses)
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, puzzle_id):
+        return os.path.join(self.directory, f"{puzzle_id}.json")
+
+    def get(self, puzzle_id):
+        # The cached board for an ID, or None if it was never stored (or its file is unreadable)
+        path = self._path(puzzle_id)
+        try:
+            with open(path, "r") as file:
+                entry = json.load(file)
+            seed, difficulty, box_size, _ = parse_puzzle_id(puzzle_id)
+            board = SudokuBoard(difficulty=difficulty, box_size=box_size, seed=seed)
+            board.load(bytes.fromhex(entry["puzzle"]), bytes.fromhex(entry["solution"]))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            # Damaged entry (or an ID of another generator version): drop it and regenerate
+            self.misses += 1
+            self._remove(path)
+            return None
+
+        board.rating = entry.get("rating")
+        board.puzzle_id = puzzle_id
+        os.utime(path)  # Mark as recently used
+        self.hits += 1
+        return board
+
+    def put(self, board):
+        # Store a generated board under its puzzle ID (boards without one are not cacheable)
+        if board.puzzle_id is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        entry = {
+            "puzzle": bytes(board.givens).hex(),
+            "solution": bytes(board.solution).hex(),
+            "rating": board.rating,
+        }
+        # Write then rename, so a crash never leaves a half-written entry behind
+        path = self._path(board.puzzle_id)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump(entry, file)
+        os.replace(temp_path, path)
+        self._evict()
+
+    def get_stats(self):
+        return {"hits": self.hits, "misses": self.misses, "max_entries": self.max_entries}
+
+    def _evict(self):
+        # Remove the least recently used entries beyond max_entries
+        with os.scandir(self.directory) as entries:
+            files = [entry for entry in entries if entry.name.endswith(".json")]
+        if len(files) <= self.max_entries:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:len(files) - self.max_entries]:
+            self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,202 @@
+import hashlib
+from itertools import permutations, product
+from operator import itemgetter
+from core.GridGeometry import GridGeometry
+
+
+class PuzzleCanonicalizer:
+    # Minimal lexicographic form (minlex) of a puzzle under the Sudoku symmetry group: transposition,
+    # band/stack swaps, row/column swaps inside them and digit relabeling (see PuzzleTransformer).
+    # Two puzzles are the same up to symmetry exactly when their forms are equal. Empty cells (0)
+    # sort first and digits are relabeled 1, 2, 3... in order of first appearance.
+    #
+    # Built row by row: each row is the smallest one reachable given the rows already fixed. Column
+    # order is only partly decided, as an ordered partition of still-interchangeable columns that every
+    # new row refines, so the search only branches on genuine ties.
+    #
+    # Meant for 9x9 (well under a millisecond per puzzle). Sparse 16x16 and 25x25 puzzles can tie on
+    # many rows and take seconds, so callers on the UI path (SudokuGame) only fingerprint 9x9 puzzles
+    def __init__(self, box_size=3):
+        self.geometry = GridGeometry.of(box_size)
+        size, box = self.geometry.size, box_size
+        self.stacks = [list(range(stack * box, stack * box + box)) for stack in range(box)]
+        self.band_rows = [list(range(band * box, band * box + box)) for band in range(box)]
+        self.transpose = itemgetter(*[col * size + row for row in range(size) for col in range(size)])
+        self._first_rows = {}  # Given count per stack -> (smallest row 0, stack orders giving it)
+
+    def canonical_form(self, grid):
+        # bytes of N*N values; grid is a flat sequence or an N x N grid (e.g. SudokuBoard.original_board)
+        size = self.geometry.size
+        cells = bytes(grid) if len(grid) == self.geometry.cell_count else bytes(v for row in grid for v in row)
+        flipped = bytes(self.transpose(cells))
+        orientations = [[cell_rows[r * size:r * size + size] for r in range(size)] for cell_rows in (cells, flipped)]
+
+        first_row, states = self._first_row_states(orientations)
+        form = bytearray(first_row)
+        for _ in range(1, size):
+            best, winners = None, []
+            for state in states:
+                rows, order, parts, labels, next_label = state
+                for r in self._candidate_rows(order):
+                    key = self._row_key(rows[r], parts, labels, next_label)
+                    if best is None or key < best:
+                        best, winners = key, [(state, r)]
+                    elif key == best:
+                        winners.append((state, r))
+            form += bytes(best)
+            states = [new for state, r in winners for new in self._expand(state, r)]
+        return bytes(form)
+
+    def fingerprint(self, grid):
+        # Compact hash of the canonical form, used as the key of PuzzleIndex
+        return hashlib.blake2b(self.canonical_form(grid), digest_size=16).digest()
+
+    def _first_row_states(self, orientations):
+        # Row 0 is the row (or column) with the fewest givens, its stacks ordered by given count;
+        # equal-count stacks and the order of givens inside a stack are branched on
+        size, box = self.geometry.size, self.geometry.box_size
+        best, winners = None, []
+        for rows in orientations:
+            for r, row in enumerate(rows):
+                counts = tuple([box - row[start:start + box].count(0) for start in range(0, size, box)])
+                if counts not in self._first_rows:
+                    self._first_rows[counts] = self._first_row(counts)
+                key, stack_orders = self._first_rows[counts]
+                if best is None or key < best:
+                    best, winners = key, [(rows, r, stack_orders)]
+                elif key == best:
+                    winners.append((rows, r, stack_orders))
+
+        states = []
+        labels = bytes(size + 1)
+        for rows, r, stack_orders in winners:
+            for parts in stack_orders:
+                states.extend(self._expand((rows, [], parts, labels, 1), r))
+        return best, states
+
+    def _first_row(self, counts):
+        # Stacks sorted by given count, each with its empty cells first
+        box = self.geometry.box_size
+        key, label = [], 1
+        for count in sorted(counts):
+            key += [0] * (box - count) + list(range(label, label + count))
+            label += count
+        stack_orders = [[self.stacks[stack] for stack in order] for order in permutations(range(box))
+                        if all(counts[order[k]] <= counts[order[k + 1]] for k in range(box - 1))]
+        return key, stack_orders
+
+    def _candidate_rows(self, order):
+        # Rows allowed at the next position: the rest of the current band, or the rows of an unused band
+        box = self.geometry.box_size
+        if len(order) % box:
+            band = order[-1] // box
+            return [r for r in self.band_rows[band] if r not in order]
+        used = {r // box for r in order}
+        return [r for band, rows in enumerate(self.band_rows) if band not in used for r in rows]
+
+    @staticmethod
+    def _row_key(row, parts, labels, next_label):
+        # Smallest relabeled row reachable by ordering the columns inside each part
+        if len(parts) == len(row):
+            key = []
+            for (c,) in parts:
+                value = row[c]
+                if not value:
+                    key.append(0)
+                elif labels[value]:
+                    key.append(labels[value])
+                else:
+                    key.append(next_label)
+                    next_label += 1
+            return key
+
+        key = []
+        for part in parts:
+            if len(part) == 1:
+                value = row[part[0]]
+                if not value:
+                    key.append(0)
+                elif labels[value]:
+                    key.append(labels[value])
+                else:
+                    key.append(next_label)
+                    next_label += 1
+                continue
+            zeros, mapped, new = 0, [], 0
+            for c in part:
+                value = row[c]
+                if not value:
+                    zeros += 1
+                elif labels[value]:
+                    mapped.append(labels[value])
+                else:
+                    new += 1
+            key += [0] * zeros
+            key += sorted(mapped)
+            key += range(next_label, next_label + new)
+            next_label += new
+        return key
+
+    @staticmethod
+    def _expand(state, r):
+        # States after placing row r: every part is split into its empty columns (still interchangeable),
+        # then known digits by label, then new digits in each possible order
+        rows, order, parts, labels, next_label = state
+        row = rows[r]
+        if len(parts) == len(row):
+            # Column order fully decided: only digits seen for the first time get labels
+            new_labels = bytearray(labels)
+            label = next_label
+            for (c,) in parts:
+                value = row[c]
+                if value and not new_labels[value]:
+                    new_labels[value] = label
+                    label += 1
+            return [(rows, order + [r], parts, new_labels, label)]
+
+        pieces = []  # Per part: (zero columns, known columns in label order, new columns)
+        branches = False
+        for part in parts:
+            if len(part) == 1:
+                value = row[part[0]]
+                if not value:
+                    pieces.append((part, (), ()))
+                elif labels[value]:
+                    pieces.append(((), part, ()))
+                else:
+                    pieces.append(((), (), part))
+                continue
+            zeros, known, new = [], [], []
+            for c in part:
+                value = row[c]
+                if not value:
+                    zeros.append(c)
+                elif labels[value]:
+                    known.append(c)
+                else:
+                    new.append(c)
+            if len(known) > 1:
+                known.sort(key=lambda c: labels[row[c]])
+            branches = branches or len(new) > 1
+            pieces.append((zeros, known, new))
+
+        if branches:
+            orders = product(*(permutations(new) for _, _, new in pieces))
+        else:
+            orders = [[new for _, _, new in pieces]]
+
+        states = []
+        for new_orders in orders:
+            new_labels = bytearray(labels)
+            new_parts = []
+            label = next_label
+            for (zeros, known, _), new in zip(pieces, new_orders):
+                if zeros:
+                    new_parts.append(zeros)
+                new_parts.extend([c] for c in known)
+                for c in new:
+                    new_labels[row[c]] = label
+                    label += 1
+                    new_parts.append([c])
+            states.append((rows, order + [r], new_parts, new_labels, label))
+        return states
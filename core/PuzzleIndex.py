@@ -0,0 +1,46 @@
+import os
+from core.PuzzleCanonicalizer import PuzzleCanonicalizer
+
+FINGERPRINT_SIZE = 16
+
+
+class PuzzleIndex:
+    def __init__(self, path=None):
+        # Hash set of puzzle fingerprints (hash of the canonical form, see PuzzleCanonicalizer), so a
+        # puzzle is recognised under any symmetry. With a path the index is kept in an append-only file
+        # of fixed-size fingerprints, e.g. to remember every puzzle already played
+        self.path = path
+        self.fingerprints = set()
+        self.canonicalizers = {}  # Per box size
+
+        if path and os.path.exists(path):
+            with open(path, "rb") as file:
+                data = file.read()
+            usable = len(data) - len(data) % FINGERPRINT_SIZE  # Ignore a partly written last entry
+            self.fingerprints.update(data[i:i + FINGERPRINT_SIZE] for i in range(0, usable, FINGERPRINT_SIZE))
+
+    def fingerprint(self, grid):
+        # grid: flat sequence of N*N values or N x N grid (e.g. SudokuBoard.original_board)
+        rows = len(grid) if not isinstance(grid[0], int) else int(len(grid) ** 0.5)
+        box_size = int(rows ** 0.5)
+        if box_size not in self.canonicalizers:
+            self.canonicalizers[box_size] = PuzzleCanonicalizer(box_size)
+        return self.canonicalizers[box_size].fingerprint(grid)
+
+    def __contains__(self, grid):
+        return self.fingerprint(grid) in self.fingerprints
+
+    def __len__(self):
+        return len(self.fingerprints)
+
+    def add(self, grid):
+        # Record a puzzle, returns False if it (or a symmetric copy of it) was already indexed
+        fingerprint = self.fingerprint(grid)
+        if fingerprint in self.fingerprints:
+            return False
+        self.fingerprints.add(fingerprint)
+        if self.path:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "ab") as file:
+                file.write(fingerprint)
+        return True
@@ -0,0 +1,101 @@
+import threading
+from collections import deque
+from core.SolverBudget import CancelToken, SolverBudget, get_exhaustion_stats
+from core.SudokuBoard import SudokuBoard, new_seed
+
+DIFFICULTIES = ("easy", "medium", "hard", "advanced")
+
+# Search nodes allowed per solver call of a worker: typical 9x9 checks need about 1,500 at most,
+# so only a pathological random path hits it (the cell stays a given or the fill is retried)
+WORKER_NODE_BUDGET = 20000
+
+
+class PuzzlePool:
+    def __init__(self, depth=3, difficulties=DIFFICULTIES, workers=1):
+        # Keep `depth` ready-made puzzles per difficulty, refilled by background worker threads
+        self.depth = depth
+        self.workers = workers
+        self.pools = {difficulty: deque() for difficulty in difficulties}
+        self.pending = {difficulty: 0 for difficulty in difficulties}  # Puzzles being generated right now
+
+        # Counters for puzzles served from the pool (hits) and requests that found it empty (misses)
+        self.hits = 0
+        self.misses = 0
+
+        self.discarded = 0  # Puzzles abandoned because generation was cancelled
+
+        self._condition = threading.Condition()
+        self._threads = []
+        self._running = False
+        self._token = CancelToken()  # Cancels the puzzles being generated when the pool closes
+
+    def start(self):
+        # Launch the worker threads (daemon threads, so they never keep the game from exiting)
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._token = CancelToken()
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self._worker, name="PuzzlePoolWorker", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def close(self):
+        # Stop the workers, cancelling the puzzles they are generating, and wait for them
+        with self._condition:
+            self._running = False
+            self._token.cancel()
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+
+    def take(self, difficulty):
+        # Pop a ready puzzle in O(1), or None if none is ready (the caller then generates inline)
+        with self._condition:
+            pool = self.pools.get(difficulty)
+            if not pool:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._condition.notify()  # Wake a worker to refill
+            return pool.popleft()
+
+    def get_stats(self):
+        with self._condition:
+            return {
+                "depth": {difficulty: len(pool) for difficulty, pool in self.pools.items()},
+                "target_depth": self.depth,
+                "hits": self.hits,
+                "misses": self.misses,
+                "discarded": self.discarded,
+                "budget_exhausted": get_exhaustion_stats(),  # Process-wide, by reason
+            }
+
+    def _next_difficulty(self):
+        # The difficulty with the fewest ready + pending puzzles, or None if every pool is full
+        counts = {difficulty: len(pool) + self.pending[difficulty] for difficulty, pool in self.pools.items()}
+        difficulty = min(counts, key=counts.get)
+        return difficulty if counts[difficulty] < self.depth else None
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                while self._running and self._next_difficulty() is None:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                difficulty = self._next_difficulty()
+                self.pending[difficulty] += 1
+                token = self._token
+
+            board = SudokuBoard(difficulty=difficulty, seed=new_seed())
+            generated = board.generate(budget=SolverBudget(max_nodes=WORKER_NODE_BUDGET, token=token))
+
+            with self._condition:
+                self.pending[difficulty] -= 1
+                if generated:
+                    self.pools[difficulty].append(board)
+                else:
+                    self.discarded += 1
@@ -0,0 +1,52 @@
+import random
+from operator import itemgetter
+from core.GridGeometry import GridGeometry
+
+
+class PuzzleTransformer:
+    # Validity-preserving symmetries of an N x N grid: digit relabeling, row swaps within bands,
+    # band swaps, column swaps within stacks, stack swaps and transposition. A quarter-turn rotation
+    # is a transposition followed by reversing the column order, so rotations are covered as well.
+    # Applied to a puzzle and its solution they keep a unique solution unique and keep its technique
+    # rating, so new puzzles can be derived from a seed puzzle without any search
+    def __init__(self, box_size=3, rng=random):
+        self.geometry = GridGeometry.of(box_size)
+        self.rng = rng
+
+    def random_transform(self):
+        # (cell getter, digit table): new cell i takes old cell cell_map[i], then digit d becomes table[d]
+        size = self.geometry.size
+        rows = self._line_order()
+        cols = self._line_order()
+        if self.rng.random() < 0.5:
+            cell_map = [rows[col] * size + cols[row] for row in range(size) for col in range(size)]
+        else:
+            cell_map = [rows[row] * size + cols[col] for row in range(size) for col in range(size)]
+
+        digits = list(range(1, size + 1))
+        self.rng.shuffle(digits)
+        table = bytes([0] + digits + list(range(size + 1, 256)))  # bytes.translate needs all 256 entries
+        return itemgetter(*cell_map), table
+
+    def _line_order(self):
+        # Shuffle the bands (or stacks), then the lines inside each of them
+        box = self.geometry.box_size
+        bands = list(range(box))
+        self.rng.shuffle(bands)
+        order = []
+        for band in bands:
+            lines = list(range(band * box, band * box + box))
+            self.rng.shuffle(lines)
+            order.extend(lines)
+        return order
+
+    @staticmethod
+    def apply(cells, transform):
+        # Transformed copy of a flat grid (bytes-like, N*N values)
+        cell_getter, table = transform
+        return bytes(cell_getter(cells)).translate(table)
+
+    def derive(self, puzzle, solution):
+        # A random isomorph of a puzzle and its solution (same transform for both)
+        transform = self.random_transform()
+        return self.apply(puzzle, transform), self.apply(solution, transform)
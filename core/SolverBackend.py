@@ -0,0 +1,40 @@
+from core.SolverBudget import record_exhaustion
+
+
+class SolverBackend:
+    # Common interface of the solver engines SudokuBoard can be built with.
+    # Grids are N x N lists of lists (N = 4, 9, 16 or 25, see GridGeometry) with 0 for empty cells
+    name = None
+
+    def __init__(self, rng=None):
+        # rng shuffles the candidate order when filling a grid (random generation); None = fixed order
+        self.rng = rng
+        self.nodes = 0  # Search nodes visited by the last solve/count call
+        self.budget = None  # Optional SolverBudget of the current call
+        self.status = None  # Why the last call stopped early ("nodes", "time", "cancelled"), None if it finished
+
+    def solve(self, grid, budget=None):
+        # Fill the grid in place with one solution, returns False if there is none or the budget ran
+        # out first (status tells which; the grid is then left unchanged)
+        raise NotImplementedError
+
+    def count_solutions(self, grid, limit=2, budget=None):
+        # Count solutions without modifying the grid, stopping once `limit` are found. If the budget
+        # runs out (status set) the count is only a lower bound
+        raise NotImplementedError
+
+    def _start(self, budget, limit):
+        self.nodes, self.limit, self.found = 0, limit, 0
+        self.budget, self.status = budget, None
+
+    def _exhausted(self):
+        # Checked on every search node while a budget is set; the search unwinds once it returns True
+        reason = self.budget.exceeded(self.nodes)
+        if reason:
+            self.status = reason
+            record_exhaustion(reason)
+        return reason is not None
+
+    def get_stats(self):
+        # Work done by the last call, used to compare backends
+        return {"backend": self.name, "nodes": self.nodes, "status": self.status}
@@ -0,0 +1,59 @@
+import threading
+import time
+from collections import Counter
+
+# Nodes between clock and cancellation checks (a node count check is cheap, reading the clock is not)
+CHECK_INTERVAL = 256
+
+# How often a budget stopped a solver call, by reason ("nodes", "time" or "cancelled")
+_exhausted = Counter()
+_exhausted_lock = threading.Lock()
+
+
+def record_exhaustion(reason):
+    with _exhausted_lock:
+        _exhausted[reason] += 1
+
+
+def get_exhaustion_stats():
+    with _exhausted_lock:
+        return dict(_exhausted)
+
+
+class CancelToken:
+    # Shared flag to stop solver and generator calls from another thread (e.g. when the player
+    # leaves for the menu or a worker pool shuts down)
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class SolverBudget:
+    def __init__(self, max_nodes=None, max_seconds=None, token=None):
+        # Limits for solver calls: max_nodes applies to every single solve/count call, max_seconds
+        # to everything run with this budget (the clock starts now), token cancels at any time
+        self.max_nodes = max_nodes
+        self.deadline = time.perf_counter() + max_seconds if max_seconds is not None else None
+        self.token = token
+
+    def exceeded(self, nodes):
+        # Why a call that visited `nodes` search nodes has to stop, or None to keep going
+        if self.max_nodes is not None and nodes > self.max_nodes:
+            return "nodes"
+        if nodes % CHECK_INTERVAL == 1:  # Also on the first node, so a cancelled call never starts
+            return self.stop_reason()
+        return None
+
+    def stop_reason(self):
+        # "cancelled" or "time" when nothing more should run under this budget, otherwise None
+        if self.token and self.token.cancelled:
+            return "cancelled"
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            return "time"
+        return None
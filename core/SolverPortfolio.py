@@ -0,0 +1,157 @@
+import multiprocessing
+import os
+import queue
+import time
+from collections import Counter, namedtuple
+from core.GridGeometry import GridGeometry
+from core.SolverBudget import SolverBudget
+from core.SudokuBoard import SudokuBoard
+
+# Strategies raced by default: propagation (bitmask), exact cover (DLX) and plain backtracking,
+# each with its own random candidate order. A grid that traps one of them rarely traps all
+DEFAULT_CONFIGS = (
+    {"name": "bitmask-1", "solver": "bitmask", "seed": 1},
+    {"name": "dlx-1", "solver": "dlx", "seed": 1},
+    {"name": "bitmask-2", "solver": "bitmask", "seed": 2},
+    {"name": "dlx-2", "solver": "dlx", "seed": 2},
+    {"name": "backtracking-1", "solver": "backtracking", "seed": 1},
+    {"name": "bitmask-3", "solver": "bitmask", "seed": 3},
+)
+
+# How often the waiting process looks at the budget's deadline and cancellation token
+POLL_SECONDS = 0.01
+
+# status: "solved" (value holds the answer), "unsolvable", "nodes" (every worker ran out of nodes),
+# "time", "cancelled" or "error" (value holds the message). config: name of the winning (or failing)
+# configuration
+PortfolioResult = namedtuple("PortfolioResult", ["status", "value", "config", "seconds"])
+
+
+def _worker(index, task, config, payload, max_nodes, results):
+    # Runs in a child process: one configuration of one task, reporting (index, status, value)
+    try:
+        _run(index, task, config, payload, max_nodes, results)
+    except Exception as error:
+        results.put((index, "error", f"{type(error).__name__}: {error}"))
+
+
+def _run(index, task, config, payload, max_nodes, results):
+    budget = SolverBudget(max_nodes=max_nodes) if max_nodes else None
+    if task == "generate":
+        difficulty, box_size, rating_band, seed = payload
+        board = SudokuBoard(difficulty=difficulty, solver=config["solver"], box_size=box_size, seed=seed + index)
+        if board.generate(rating_band, budget=budget):
+            # Only bitmask winners have a puzzle ID (see SudokuBoard.generate)
+            value = (bytes(board.givens), bytes(board.solution), board.rating, board.seed, board.puzzle_id)
+            results.put((index, "solved", value))
+        else:
+            results.put((index, "nodes", None))
+        return
+
+    cells, limit = payload
+    board = SudokuBoard(board=cells, solver=config["solver"], seed=config["seed"])
+    if task == "solve":
+        solved = board.solve(budget)
+        if solved:
+            results.put((index, "solved", bytes(board.cells)))
+        else:
+            results.put((index, board.solver.status or "unsolvable", None))
+    else:
+        count = board.count_solutions(limit, budget)
+        results.put((index, board.solver.status or "solved", count))
+
+
+class SolverPortfolio:
+    def __init__(self, configs=DEFAULT_CONFIGS, workers=None):
+        # Races several solver configurations in worker processes, keeps the first definitive answer
+        # and terminates the rest. Starting processes costs a few milliseconds, so this pays off for
+        # hard grids and large boards, where one strategy can take far longer than the others
+        self.configs = list(configs)[:workers or os.cpu_count() or 1]
+        self.wins = Counter()  # Races won per configuration name
+        self.races = 0
+
+    def solve(self, grid, budget=None):
+        # value: flat bytes of the solved grid (grid: N x N or flat sequence of N*N values)
+        return self._race("solve", (self._flat(grid), 1), budget)
+
+    def count_solutions(self, grid, limit=2, budget=None):
+        # value: number of solutions capped at `limit` (the first backend to finish answers)
+        return self._race("count", (self._flat(grid), limit), budget)
+
+    def generate(self, difficulty="medium", box_size=3, rating_band=None, seed=0, budget=None):
+        # value: a generated SudokuBoard. Configuration i generates from seed + i, so a bitmask
+        # winner can be generated again from its puzzle ID
+        result = self._race("generate", (difficulty, box_size, rating_band, seed), budget)
+        if result.status == "solved":
+            givens, solution, rating, board_seed, puzzle_id = result.value
+            board = SudokuBoard(difficulty=difficulty, box_size=box_size, seed=board_seed)
+            board.load(givens, solution)
+            board.rating = rating
+            board.puzzle_id = puzzle_id
+            result = result._replace(value=board)
+        return result
+
+    @staticmethod
+    def _flat(grid):
+        # Flat bytes of the grid, rejecting unsupported sizes before any process is started
+        cells = bytes(grid) if isinstance(grid[0], int) else bytes(value for row in grid for value in row)
+        box_size = round(len(cells) ** 0.25)
+        if box_size ** 4 != len(cells):
+            raise ValueError(f"Not a square-box grid: {len(cells)} cells")
+        GridGeometry.of(box_size)
+        return cells
+
+    def _race(self, task, payload, budget):
+        start = time.perf_counter()
+        results = multiprocessing.Queue()
+        max_nodes = budget.max_nodes if budget else None
+        processes = [multiprocessing.Process(target=_worker, args=(index, task, config, payload, max_nodes, results),
+                                             daemon=True)
+                     for index, config in enumerate(self.configs)]
+        for process in processes:
+            process.start()
+
+        outcome = None
+        error = None  # (configuration, message) of the first worker that failed
+        pending = len(processes)
+        try:
+            while pending:
+                stopped = budget.stop_reason() if budget else None
+                if stopped:
+                    outcome = PortfolioResult(stopped, None, None, 0.0)
+                    break
+                try:
+                    index, status, value = results.get(timeout=POLL_SECONDS)
+                except queue.Empty:
+                    if not any(process.is_alive() for process in processes) and results.empty():
+                        error = error or (None, "a worker exited without answering")
+                        break
+                    continue
+                pending -= 1
+                name = self.configs[index]["name"]
+                if status == "error":
+                    error = error or (name, value)
+                elif status in ("solved", "unsolvable"):
+                    # Solvers are exact: "no solution" from any of them settles the race too
+                    outcome = PortfolioResult(status, value, name, 0.0)
+                    self.wins[name] += 1
+                    break
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            for process in processes:
+                process.join()
+            results.close()
+
+        if outcome is None:
+            # No answer: a failing worker is reported as such, not as an exhausted budget
+            if error:
+                outcome = PortfolioResult("error", error[1], error[0], 0.0)
+            else:
+                outcome = PortfolioResult("nodes", None, None, 0.0)
+        self.races += 1
+        return outcome._replace(seconds=time.perf_counter() - start)
+
+    def get_stats(self):
+        return {"races": self.races, "wins": dict(self.wins)}
@@ -1,100 +1,539 @@
 import random
+import threading
+from array import array
+from core.BacktrackingSolver import BacktrackingSolver
+from core.BitmaskSolver import BitmaskSolver
+from core.DifficultyRater import DIFFICULTY_BANDS, DifficultyRater
+from core.DLXSolver import DLXSolver
+from core.GridGeometry import MAX_BOX_SIZE, MIN_BOX_SIZE, GridGeometry
+from core.PuzzleTransformer import PuzzleTransformer
+
+# Solver engines selectable by name when creating a board
+SOLVER_BACKENDS = {
+    BacktrackingSolver.name: BacktrackingSolver,
+    BitmaskSolver.name: BitmaskSolver,
+    DLXSolver.name: DLXSolver,
+}
+
+# Shared so ratings memoized for one board are free for every other board
+RATER = DifficultyRater()
+
+# Solver instances are reused per thread instead of being stored on every board
+_solvers = threading.local()
+
+# Seed puzzles of generate(method="transform") per (box size, difficulty, rating band):
+# [puzzle, solution, rating, puzzles derived so far]. A seed is replaced after SEED_USES derivations
+SEED_USES = 1000
+_seeds = {}
+_seeds_lock = threading.Lock()
+
+# Share of the cells blanked per difficulty (30, 40, 50 and 55 of the 81 cells of a 9x9 board)
+REMOVAL_RATIOS = {
+    "easy": 30 / 81,
+    "medium": 40 / 81,
+    "hard": 50 / 81,
+    "advanced": 55 / 81
+}
+
+# Large grids cannot keep a unique solution with as many blanks, so their share is capped
+MAX_REMOVAL_RATIO = {2: 0.75, 3: 1.0, 4: 0.55, 5: 0.45}
+
+# While targeting a rating band, blanks added (puzzle too easy) or put back (too hard) per attempt,
+# between the "easy" share and the 17 givens a unique 9x9 puzzle needs at least
+BAND_STEP = 2
+MIN_GIVENS = 17
+
+# Part of every puzzle ID. Bump it whenever a change makes a seed generate a different puzzle
+# (solver order, removal order, ratios...), so old IDs are not served a different puzzle
+GENERATOR_VERSION = 3
+
+
+def make_puzzle_id(seed, difficulty, box_size=3, rating_band=None):
+    # Stable, shareable ID of a seeded puzzle, e.g. "3-9x9-hard-48213" or "3-9x9-hard-r3.4-48213"
+    size = box_size * box_size
+    band = f"r{rating_band[0]}.{rating_band[1]}-" if rating_band else ""
+    return f"{GENERATOR_VERSION}-{size}x{size}-{difficulty}-{band}{int(seed)}"
+
+
+def new_seed():
+    # Random seed for a fresh puzzle, so even unrequested puzzles get an ID that can be shared
+    return random.getrandbits(32)
+
+
+def parse_puzzle_id(puzzle_id):
+    # (seed, difficulty, box_size, rating_band) of an ID made by make_puzzle_id
+    parts = puzzle_id.split("-")
+    try:
+        version, dimensions, difficulty, *band, seed = parts
+        rows, cols = (int(side) for side in dimensions.split("x"))
+        rating_band = tuple(int(level) for level in band[0][1:].split(".")) if band else None
+        seed = int(seed)
+    except (ValueError, IndexError):
+        raise ValueError(f"Malformed puzzle ID: {puzzle_id}")
+    box_size = int(rows ** 0.5)
+    if rows != cols or box_size * box_size != rows or not MIN_BOX_SIZE <= box_size <= MAX_BOX_SIZE:
+        raise ValueError(f"Unsupported board size in puzzle ID: {puzzle_id}")
+    if difficulty not in REMOVAL_RATIOS:
+        raise ValueError(f"Unknown difficulty in puzzle ID: {puzzle_id}")
+    if version != str(GENERATOR_VERSION):
+        raise ValueError(f"Puzzle ID {puzzle_id} is from another generator version")
+    if len(band) > 1 or (rating_band and len(rating_band) != 2):
+        raise ValueError(f"Malformed puzzle ID: {puzzle_id}")
+    if rating_band and rating_band[0] > rating_band[1]:
+        raise ValueError(f"Inverted rating band in puzzle ID: {puzzle_id}")
+    if rating_band and box_size != 3:
+        raise ValueError(f"Rating bands are only available for 9x9 puzzles: {puzzle_id}")
+    return seed, difficulty, box_size, rating_band
+
+
+def _flatten(grid, geometry):
+    # Accept a flat sequence of N*N values or an N x N grid (lists of lists or GridView rows)
+    if len(grid) == geometry.cell_count:
+        return bytes(grid)
+    if len(grid) != geometry.size:
+        raise ValueError(f"Expected a {geometry.size}x{geometry.size} grid")
+    return bytes(value for row in grid for value in row)
+
+
+def _geometry_of(board):
+    # Geometry of a flat (N*N values) or 2-D (N rows) starting board
+    rows = len(board)
+    if isinstance(board[0], int):
+        rows = int(rows ** 0.5)
+    return GridGeometry.of(int(rows ** 0.5))
+
+
+class GridView:
+    # Read-only 2-D access (view[row][col]) to a flat N*N byte buffer without copying it
+    __slots__ = ("flat", "size")
+
+    def __init__(self, buffer, size):
+        self.flat = memoryview(buffer).toreadonly()
+        self.size = size
+
+    def __getitem__(self, row):
+        size = self.size
+        return self.flat[row * size:row * size + size]
+
+    def __iter__(self):
+        size = self.size
+        return (self.flat[row * size:row * size + size] for row in range(size))
+
+    def __len__(self):
+        return self.size
 
 
 class SudokuBoard:
-    def __init__(self, board=None, difficulty="medium"):
+    MAX_GENERATION_ATTEMPTS = 5
+    MAX_RATING_ATTEMPTS = 50
+
+    # Compact layout: each layer is one bytearray(N*N) (cell index = row * N + col), so copying or
+    # resetting a board is a buffer copy. board/original_board/solution_board are 2-D views of them
+    __slots__ = (
+        "difficulty", "rating", "solver_name", "geometry", "seed", "rng", "puzzle_id", "budget_hits",
+        "cells", "givens", "solution", "board", "original_board", "solution_board",
+        "unit_masks", "unit_counts", "empty_cells", "_empty_slots", "conflicts",
+        "conflict_cells", "_conflict_units", "dirty", "_initial_index",
+    )
+
+    def __init__(self, board=None, difficulty="medium", solver="bitmask", box_size=3, seed=None):
         # Store difficulty level
         self.difficulty = difficulty
+        self.rating = None  # Technique rating of the puzzle, set when generating for a rating band
+
+        # With a seed, generate() always makes the same puzzle and names it with a puzzle ID
+        # (see make_puzzle_id); without one it draws from the global random module
+        self.seed = seed
+        self.rng = random.Random(seed) if seed is not None else random
+        self.puzzle_id = None
+        self.budget_hits = 0  # Solver calls of the last generate() stopped by its budget
+
+        # Solver engine used for generation, solving and uniqueness checks
+        if solver not in SOLVER_BACKENDS:
+            raise ValueError(f"Unknown solver backend: {solver}")
+        self.solver_name = solver
+
+        # Grid dimensions: N x N cells in box_size x box_size boxes (N = box_size ** 2, 4x4 up to 25x25)
+        self.geometry = _geometry_of(board) if board else GridGeometry.of(box_size)
 
         # If a board is provided (e.g. for testing or loading), use it
         if board:
-            self.board = board  # The current game board (user may modify this)
-            self.original_board = [row[:] for row in board]  # Copy for resets
-            self.solution_board = [row[:] for row in board]  # Full solution copy
+            self.cells = bytearray(_flatten(board, self.geometry))  # The current game board (user may modify this)
+            self.givens = bytearray(self.cells)  # Copy for resets
+            self.solution = bytearray(self.cells)  # Full solution copy
         else:
-            # Create empty 9x9 boards for game start
-            self.board = [[0 for _ in range(9)] for _ in range(9)]
-            self.original_board = [[0 for _ in range(9)] for _ in range(9)]
-            self.solution_board = [[0 for _ in range(9)] for _ in range(9)]
+            # Create empty boards for game start
+            self.cells = bytearray(self.geometry.cell_count)
+            self.givens = bytearray(self.geometry.cell_count)
+            self.solution = bytearray(self.geometry.cell_count)
+
+        self.board = GridView(self.cells, self.size)
+        self.original_board = GridView(self.givens, self.size)
+        self.solution_board = GridView(self.solution, self.size)
+        self._rebuild_index()
+
+    @property
+    def size(self):
+        return self.geometry.size
+
+    @property
+    def box_size(self):
+        return self.geometry.box_size
+
+    @property
+    def solver(self):
+        cache = _solvers.__dict__.setdefault("by_name", {})
+        if self.solver_name not in cache:
+            cache[self.solver_name] = SOLVER_BACKENDS[self.solver_name](rng=random)
+        return cache[self.solver_name]
+
+    def copy(self):
+        # Independent board with the same puzzle, solution and progress (three buffer copies)
+        clone = SudokuBoard(difficulty=self.difficulty, solver=self.solver_name, box_size=self.box_size,
+                            seed=self.seed)
+        clone.rating = self.rating
+        clone.puzzle_id = self.puzzle_id
+        clone.cells[:] = self.cells
+        clone.givens[:] = self.givens
+        clone.solution[:] = self.solution
+        clone._rebuild_index()
+        return clone
+
+    def _rebuild_index(self):
+        # Recompute the incremental lookup state from scratch; only needed when the whole board
+        # is replaced (generate, load, solve). Moves go through set_cell and update it in O(1).
+        # Units 0..N-1 are rows, N..2N-1 columns and 2N..3N-1 boxes (see GridGeometry)
+        size = self.size
+        self.unit_masks = array("L", [0]) * (3 * size)  # Bit d set when digit d is present in the unit
+        self.unit_counts = bytearray(3 * size * (size + 1))  # Occurrences of digit d in unit u at u * (N + 1) + d
+        self.empty_cells = array("H")  # Cell index of every empty cell, in no particular order
+        self._empty_slots = array("H", [0]) * len(self.cells)  # Position of each empty cell in empty_cells
+        self.conflicts = 0  # Surplus duplicates over all units (0 means no row/column/box repeats a digit)
+        self.conflict_cells = set()  # Cells whose digit repeats in one of their units, e.g. for highlighting
+        self._conflict_units = bytearray(len(self.cells))  # Per cell: units in which its digit repeats
+        self.dirty = True  # Set on every change, cleared by whoever consumes it (see SudokuGame)
+
+        # Index state of the puzzle without user input, restored by clear_user_inputs. Cells are placed
+        # one by one, so the duplicate lookups in _add_digit only ever see cells already indexed
+        user_cells = bytes(self.cells)
+        self.cells[:] = bytes(len(self.cells))
+        for i, value in enumerate(self.givens):
+            if value:
+                self.cells[i] = value
+                self._add_digit(i, value)
+            else:
+                self._add_empty(i)
+        self._initial_index = (bytes(self.unit_counts), self.unit_masks.tobytes(),
+                               self.empty_cells.tobytes(), self._empty_slots.tobytes(), self.conflicts,
+                               bytes(self._conflict_units), frozenset(self.conflict_cells))
+
+        for i, value in enumerate(user_cells):
+            if value != self.givens[i]:
+                self.set_cell(i // size, i % size, value)
+
+    def _add_digit(self, i, value):
+        # Expects cells[i] == value already
+        bit = 1 << value
+        stride = self.size + 1
+        for unit in self.geometry.cell_units[i]:
+            self.unit_counts[unit * stride + value] += 1
+            count = self.unit_counts[unit * stride + value]
+            if count > 1:
+                self.conflicts += 1
+                if count == 2:
+                    self._mark_conflict(self._other_with(unit, i, value), 1)  # First repeat in the unit
+                self._mark_conflict(i, 1)
+            self.unit_masks[unit] |= bit
+
+    def _remove_digit(self, i, value):
+        # Expects cells[i] == value still
+        stride = self.size + 1
+        for unit in self.geometry.cell_units[i]:
+            count = self.unit_counts[unit * stride + value]
+            if count > 1:
+                self.conflicts -= 1
+                if count == 2:
+                    self._mark_conflict(self._other_with(unit, i, value), -1)  # Its last repeat goes away
+                self._mark_conflict(i, -1)
+            self.unit_counts[unit * stride + value] -= 1
+            if not self.unit_counts[unit * stride + value]:
+                self.unit_masks[unit] &= ~(1 << value)
+
+    def _other_with(self, unit, i, value):
+        # The other cell holding `value` in a unit that holds it twice (only scanned on duplicates)
+        cells = self.cells
+        for j in self.geometry.units[unit]:
+            if cells[j] == value and j != i:
+                return j
+
+    def _mark_conflict(self, i, delta):
+        self._conflict_units[i] += delta
+        if self._conflict_units[i]:
+            self.conflict_cells.add(i)
+        else:
+            self.conflict_cells.discard(i)
+
+    def _add_empty(self, i):
+        self._empty_slots[i] = len(self.empty_cells)
+        self.empty_cells.append(i)
+
+    def _remove_empty(self, i):
+        # Swap the last empty cell into the freed slot
+        slot = self._empty_slots[i]
+        last = self.empty_cells.pop()
+        if last != i:
+            self.empty_cells[slot] = last
+            self._empty_slots[last] = slot
+
+    def set_cell(self, row, col, value):
+        # Write a value (0 clears the cell) and update masks, counts and the empty list in O(1)
+        i = row * self.size + col
+        old = self.cells[i]
+        if old == value:
+            return
+        if old:
+            self._remove_digit(i, old)
+        else:
+            self._remove_empty(i)
+
+        self.cells[i] = value
+        self.dirty = True
+        if value:
+            self._add_digit(i, value)
+        else:
+            self._add_empty(i)
+
+    def get_candidates(self, row, col):
+        # Digits not yet used in the cell's row, column or box
+        used = 0
+        for unit in self.geometry.cell_units[row * self.size + col]:
+            used |= self.unit_masks[unit]
+        return [digit for digit in range(1, self.size + 1) if not used & (1 << digit)]
+
+    def count_empty(self):
+        return len(self.empty_cells)
+
+    def is_solved(self):
+        # Every cell filled and no unit repeats a digit, read from the counters in O(1)
+        return not self.empty_cells and self.conflicts == 0
+
+    def generate(self, rating_band=None, method="search", budget=None):
+        # Optional SolverBudget: a solver call running out of nodes is retried on a fresh random path
+        # (or, when checking uniqueness, the cell simply stays a given). Running out of time or being
+        # cancelled stops generation: returns False and leaves the board empty. Otherwise True
+        self.budget_hits = 0
+        self.puzzle_id = None
 
-    def generate(self):
         # Map difficulty to number of cells to remove
-        difficulty_mapping = {
-            "easy": 30,
-            "medium": 40,
-            "hard": 50,
-            "advanced": 55
-        }
-        empty_cells = difficulty_mapping.get(self.difficulty, 40)
+        ratio = min(REMOVAL_RATIOS.get(self.difficulty, REMOVAL_RATIOS["medium"]), MAX_REMOVAL_RATIO[self.box_size])
+        empty_cells = round(ratio * self.geometry.cell_count)
+
+        # Optionally keep generating until the hardest technique needed falls in a rating band,
+        # given as (min_level, max_level) or a difficulty name from DIFFICULTY_BANDS
+        if isinstance(rating_band, str):
+            rating_band = DIFFICULTY_BANDS[rating_band]
+        if rating_band and self.box_size != 3:
+            raise ValueError("Technique ratings are only available for 9x9 boards")
+
+        # A seeded board restarts its random stream, so every call makes the same puzzle
+        if self.seed is not None:
+            if method != "search":
+                raise ValueError("Seeded boards can only be generated by search")
+            self.rng = random.Random(self.seed)
+
+        # "transform" derives the puzzle from a cached seed puzzle instead of searching (see derive_from)
+        if method == "transform":
+            return self._generate_transformed(rating_band, budget)
+        if method != "search":
+            raise ValueError(f"Unknown generation method: {method}")
 
-        # Step 1: Solve the board fully to generate a complete board
-        self.solve()
+        best = None
+        min_blanks = round(REMOVAL_RATIOS["easy"] * self.geometry.cell_count)
+        max_blanks = self.geometry.cell_count - MIN_GIVENS
+        for _ in range(self.MAX_RATING_ATTEMPTS if rating_band else 1):
+            # A band attempt that falls short of its blank count is rated as it is, no new grid needed
+            if not self._generate_unique(empty_cells, budget, retry_short=not rating_band):
+                if best:
+                    break  # Out of time while targeting a rating band: settle for the closest so far
+                self.load(bytes(len(self.cells)), bytes(len(self.cells)))
+                return False
+            if not rating_band:
+                break
 
-        # Step 2: Store the full solution for hint checking later
-        self.solution_board = [row[:] for row in self.board]
+            self.rating = RATER.rate(self.board)
+            low, high = rating_band
+            distance = max(low - self.rating["level"], self.rating["level"] - high, 0)
+            if best is None or distance < best[0]:
+                best = (distance, bytes(self.cells), bytes(self.solution), self.rating)
+            if distance == 0:
+                break
+            # The blank count sets how hard a puzzle can get, so walk it towards the band
+            step = BAND_STEP if self.rating["level"] < low else -BAND_STEP
+            empty_cells = min(max(empty_cells + step, min_blanks), max_blanks)
 
-        # Step 3: Remove some cells to form the playable puzzle
-        self._remove_numbers(empty_cells)
+        # Keep the closest puzzle if no attempt landed inside the band
+        if best:
+            _, cells, solution, self.rating = best
+            self.cells[:] = cells
+            self.solution[:] = solution
 
         # Step 4: Store puzzle state to allow clearing later
-        self.original_board = [row[:] for row in self.board]
+        self.givens[:] = self.cells
+        self._rebuild_index()
+        # A budget changes the random path, so the seed alone would not give this puzzle again. IDs are
+        # replayed with the default solver, the other backends walk a different path from the same seed
+        if self.seed is not None and not self.budget_hits and self.solver_name == BitmaskSolver.name:
+            self.puzzle_id = make_puzzle_id(self.seed, self.difficulty, self.box_size, rating_band)
+        return True
 
-    def solve(self, i=0, j=0):
-        # Backtracking recursive solver
-        if i == 9:
-            i, j = 0, j + 1
-            if j == 9:
-                return True  # Fully solved
+    def _generate_transformed(self, rating_band, budget):
+        key = (self.box_size, self.difficulty, tuple(rating_band) if rating_band else None)
+        with _seeds_lock:
+            seed = _seeds.get(key)
+            if seed and seed[3] < SEED_USES:
+                seed[3] += 1
+            else:
+                seed = None
 
-        if self.board[i][j] != 0:
-            return self.solve(i + 1, j)  # Move to next cell
+        if seed is None:
+            # Search for a fresh seed outside the lock, the other threads keep using the old one
+            board = SudokuBoard(difficulty=self.difficulty, solver=self.solver_name, box_size=self.box_size)
+            if not board.generate(rating_band, budget=budget):
+                self.budget_hits = board.budget_hits
+                return False
+            seed = [bytes(board.givens), bytes(board.solution), board.rating, 1]
+            with _seeds_lock:
+                _seeds[key] = seed
 
-        for num in random.sample(range(1, 10), 9):  # Try random numbers 1-9
-            if self._is_valid(num, (i, j)):
-                self.board[i][j] = num
-                if self.solve(i + 1, j):
-                    return True
-                self.board[i][j] = 0  # Backtrack
+        self.derive_from(*seed[:3])
+        return True
 
-        return False  # No valid number found
+    def derive_from(self, puzzle, solution, rating=None):
+        # Load a random isomorph of a puzzle (flat givens and solution of this board's size): same
+        # uniqueness and technique rating, no search. Puzzles derived from one seed are all the same
+        # puzzle up to symmetry, so bulk tools should refresh their seeds now and then
+        transformer = PuzzleTransformer(self.box_size, rng=self.rng)
+        puzzle, solution = transformer.derive(puzzle, solution)
+        self.load(puzzle, solution)
+        self.rating = rating
 
-    def _is_valid(self, num, pos):
-        row, col = pos
+    def _generate_unique(self, empty_cells, budget=None, retry_short=True):
+        # Not every full grid can lose that many cells while staying unique, so retry with a new one
+        # (unless retry_short is False) and keep the attempt with the most blanks. Returns False if the budget stopped generation
+        # before any puzzle was made
+        best = None  # (blanks, puzzle, solution) of the best finished attempt
+        for _ in range(self.MAX_GENERATION_ATTEMPTS):
+            # Step 1: Solve the board fully to generate a complete board
+            self.cells[:] = bytes(len(self.cells))
+            if not self.solve(budget):
+                if budget and budget.stop_reason():
+                    return False
+                continue  # Node budget ran out on this random path, try another one
 
-        # --- Row check ---
-        if any(self.board[row][i] == num for i in range(9) if i != col):
-            return False
+            # Step 2: Store the full solution for hint checking later
+            self.solution[:] = self.cells
 
-        # --- Column check ---
-        if any(self.board[i][col] == num for i in range(9) if i != row):
+            # Step 3: Remove some cells to form the playable puzzle (single solution only)
+            removed = self._remove_numbers(empty_cells, budget)
+            if removed is None:
+                return False
+            if best is None or removed > best[0]:
+                best = (removed, bytes(self.cells), bytes(self.solution))
+            if removed == empty_cells or not retry_short:
+                break
+
+        # A later attempt may have stopped after clearing the grid, so restore the kept one
+        if best is None:
             return False
+        _, puzzle, solution = best
+        self.cells[:] = puzzle
+        self.solution[:] = solution
+        return True
 
-        # --- 3x3 Box check ---
-        box_x, box_y = col // 3, row // 3
-        for i in range(box_y * 3, box_y * 3 + 3):
-            for j in range(box_x * 3, box_x * 3 + 3):
-                if self.board[i][j] == num and (i, j) != pos:
-                    return False
+    def rate(self):
+        # Hardest human technique the puzzle needs (memoized), see DifficultyRater. 9x9 boards only
+        if self.box_size != 3:
+            return None
+        return RATER.rate(self.original_board)
+
+    def load(self, puzzle, solution):
+        # Use an existing puzzle and its solution (e.g. from a puzzle bank) instead of generating one.
+        # Both may be flat sequences of N*N values or N x N grids of this board's size
+        self.cells[:] = _flatten(puzzle, self.geometry)
+        self.givens[:] = self.cells
+        self.solution[:] = _flatten(solution, self.geometry)
+        self.puzzle_id = None  # Callers restoring a known puzzle (e.g. PuzzleCache) set it again
+        self._rebuild_index()
+
+    def solve(self, budget=None):
+        # Fill the board with the selected solver, candidates tried in random order. False if there is
+        # no solution or the optional SolverBudget ran out (the board is then unchanged)
+        grid = [list(row) for row in self.board]
+        solver = self.solver
+        solver.rng = self.rng  # Solvers are shared per thread, the random stream belongs to the board
+        solved = solver.solve(grid, budget)
+        if solver.status:
+            self.budget_hits += 1
+        if solved:
+            self.cells[:] = _flatten(grid, self.geometry)
+            self._rebuild_index()
+        return solved
 
-        return True  # All checks passed
+    def count_solutions(self, limit=2, budget=None):
+        # Number of solutions of the current board, capped at `limit` (e.g. to validate imported puzzles).
+        # With a budget the count is only a lower bound when solver.status is set afterwards
+        count = self.solver.count_solutions(self.board, limit, budget)
+        if self.solver.status:
+            self.budget_hits += 1
+        return count
+
+    def _is_valid(self, num, pos):
+        # O(1) check against the digit counts, ignoring the cell's own current value
+        row, col = pos
+        i = row * self.size + col
+        stride = self.size + 1
+        own = 1 if self.cells[i] == num else 0
+        return all(self.unit_counts[unit * stride + num] == own for unit in self.geometry.cell_units[i])
 
     def is_move_valid(self, number, position):
         # Wrapper for public validation
         return self._is_valid(number, position)
 
-    def _remove_numbers(self, count):
-        # Randomly remove `count` number of cells from the full board
+    def _remove_numbers(self, count, budget=None):
+        # Blank up to `count` cells in random order, keeping a blank only if the puzzle
+        # still has exactly one solution. Returns how many cells were removed, or None if
+        # the budget ran out of time or was cancelled
+        cells = list(range(len(self.cells)))
+        self.rng.shuffle(cells)
+
         removed = 0
-        while removed < count:
-            row = random.randint(0, 8)
-            col = random.randint(0, 8)
-            if self.board[row][col] != 0:
-                self.board[row][col] = 0
+        for i in cells:
+            if removed == count:
+                break
+            value = self.cells[i]
+            self.cells[i] = 0
+            if self.count_solutions(2, budget) == 1 and not self.solver.status:
                 removed += 1
+            else:
+                # Removing it would allow a second solution (or uniqueness could not be proven in budget)
+                self.cells[i] = value
+                if budget and budget.stop_reason():
+                    return None
+        return removed
 
     def clear_user_inputs(self):
-        # Reset the board back to its original state (before any user input)
-        self.board = [row[:] for row in self.original_board]
+        # Reset the board back to its original state (before any user input): buffer copies of
+        # the puzzle and of the index state saved for it
+        counts, masks, empty_cells, slots, conflicts, conflict_units, conflict_cells = self._initial_index
+        self.cells[:] = self.givens
+        self.unit_counts[:] = counts
+        self.unit_masks = array("L", masks)
+        self.empty_cells = array("H", empty_cells)
+        self._empty_slots = array("H", slots)
+        self.conflicts = conflicts
+        self._conflict_units[:] = conflict_units
+        self.conflict_cells = set(conflict_cells)
+        self.dirty = True
 
     def get_cell_hint(self, row, col):
         # Returns the correct answer for a cell, or None if already filled
@@ -1,31 +1,92 @@
+from core.HintEngine import HintEngine
+from core.MoveLog import MoveLog
 from core.SudokuBoard import *
 from core.Timer import *
 
+# Shared so a hint found for a board state is free for every later request (and every game)
+HINTS = HintEngine()
+
 
 class SudokuGame:
-    def __init__(self, difficulty='medium', point_tracker=None, renderer=None):
+    MAX_FRESH_PUZZLE_ATTEMPTS = 5  # Puzzles tried before accepting one that was played before
+
+    def __init__(self, difficulty='medium', point_tracker=None, renderer=None, puzzle_source=None, box_size=3,
+                 played_puzzles=None, seed=None, puzzle_cache=None, hint_engine=None, rating_band=None):
         # Game setup
         self.difficulty = difficulty
-        self.board = SudokuBoard(difficulty=self.difficulty)  # Handles puzzle logic
+        self.box_size = box_size  # 2 -> 4x4, 3 -> 9x9, 4 -> 16x16, 5 -> 25x25
+        self.board = SudokuBoard(difficulty=self.difficulty, box_size=box_size)  # Handles puzzle logic
         self.selected_cell = None  # Currently selected cell by the player
         self.timer = Timer()  # In-game timer
         self.mistakes = 0  # Count of incorrect inputs
         self.hints_used = 0  # Number of hints taken
         self.last_hint = None  # Track last hint location
+        self.last_hint_reason = None  # Why the last hint's digit is right, e.g. "hidden single in row 4"
+        self.hint_engine = hint_engine or HINTS  # Finds the easiest deducible cell
+        self.moves = MoveLog()  # Every change to the board, for undo/redo and saving the session
         self.point_tracker = point_tracker  # Handles level/point logic (external)
         self.renderer = renderer  # Responsible for UI rendering
         self.hint_filled_cells = set()  # Tracks cells filled via hint (excluded from scoring)
+        self.puzzle_source = puzzle_source  # Optional supplier of ready puzzles (e.g. PuzzlePool)
+        self.played_puzzles = played_puzzles  # Optional PuzzleIndex of 9x9 puzzles already played
+        self.seed = seed  # Play one specific puzzle (e.g. a shared challenge) instead of a fresh one
+        self.rating_band = rating_band  # Technique rating band the seeded puzzle was generated for, if any
+        self.puzzle_cache = puzzle_cache  # Optional PuzzleCache of seeded puzzles
+
+    @classmethod
+    def from_puzzle_id(cls, puzzle_id, **kwargs):
+        # Game of the puzzle named by an ID (see make_puzzle_id), raises ValueError for a bad ID
+        seed, difficulty, box_size, rating_band = parse_puzzle_id(puzzle_id)
+        return cls(difficulty=difficulty, box_size=box_size, seed=seed, rating_band=rating_band, **kwargs)
 
     def start_new_game(self):
-        # Reset game state and regenerate puzzle
-        self.board = SudokuBoard(difficulty=self.difficulty)
-        self.board.generate()
+        # Reset game state and take a ready puzzle, generating one inline only if none is available.
+        # Puzzle sources and the played-puzzle index only cover 9x9 puzzles
+        if self.seed is not None:
+            board = self._seeded_board()
+            if self._tracks_played():
+                self.played_puzzles.add(board.original_board)  # Played again on purpose, just record it
+        else:
+            board = self._fresh_board()
+        self.board = board
+        if self.renderer:
+            self.renderer.set_grid_size(board.size)
         self.timer.reset()
         self.mistakes = 0
         self.hints_used = 0
+        self.last_hint = None
+        self.last_hint_reason = None
         self.hint_filled_cells.clear()
+        self.moves = MoveLog()
         self.selected_cell = None
 
+    def _seeded_board(self):
+        # The same seed always gives the same puzzle, so it is generated once and then read from the cache
+        puzzle_id = make_puzzle_id(self.seed, self.difficulty, self.box_size, self.rating_band)
+        board = self.puzzle_cache.get(puzzle_id) if self.puzzle_cache else None
+        if board is None:
+            board = SudokuBoard(difficulty=self.difficulty, box_size=self.box_size, seed=self.seed)
+            board.generate(self.rating_band)
+            if self.puzzle_cache:
+                self.puzzle_cache.put(board)
+        return board
+
+    def _fresh_board(self):
+        for _ in range(self.MAX_FRESH_PUZZLE_ATTEMPTS):
+            board = self.puzzle_source.take(self.difficulty) if self.puzzle_source and self.box_size == 3 else None
+            if board is None:
+                board = SudokuBoard(difficulty=self.difficulty, box_size=self.box_size, seed=new_seed())
+                board.generate()
+            # Skip puzzles played before, even if rotated, mirrored or relabeled
+            if not self._tracks_played() or self.played_puzzles.add(board.original_board):
+                break
+        return board
+
+    def _tracks_played(self):
+        # Fingerprinting runs while "New Game" waits and the canonical form search does not scale
+        # past 9x9 (seconds for some 25x25 puzzles). `is not None`: an empty index is falsy
+        return self.played_puzzles is not None and self.box_size == 3
+
     def select_cell(self, pos):
         # Convert screen coordinates to board coordinates
         if not self.renderer:
@@ -46,11 +107,11 @@ class SudokuGame:
 
     def input_number(self, number):
         # Place a number if valid (not original cell and value is correct)
-        if self.selected_cell:
+        if self.selected_cell and 1 <= number <= self.board.size:
             row, col = self.selected_cell
             if self.board.original_board[row][col] == 0:
                 if self.board.is_move_valid(number, (row, col)):
-                    self.board.board[row][col] = number  # Place number
+                    self._change(row, col, number, "input")  # Place number
                 else:
                     self.mistakes += 1  # Invalid move = mistake
 
@@ -59,67 +120,87 @@ class SudokuGame:
         if self.selected_cell:
             row, col = self.selected_cell
             if self.board.original_board[row][col] == 0:
-                self.board.board[row][col] = 0
+                self._change(row, col, 0, "delete")
 
     def clear_board(self):
-        # Reset puzzle back to original state
+        # Reset puzzle back to original state, recorded as one step so it can be undone
+        cells, givens = self.board.cells, self.board.givens
+        changes = [(i, value, 0) for i, value in enumerate(cells) if value != givens[i]]
+        self.moves.record(changes, "clear")
         self.board.clear_user_inputs()
 
+    def _change(self, row, col, value, kind):
+        i = row * self.board.size + col
+        old = self.board.cells[i]
+        if old != value:
+            self.moves.record([(i, old, value)], kind)
+            self.board.set_cell(row, col, value)
+
+    def undo(self):
+        # Revert the last recorded step, returns False if there is nothing to undo
+        return self._replay(self.moves.undo())
+
+    def redo(self):
+        # Apply the last undone step again, returns False if there is nothing to redo
+        return self._replay(self.moves.redo())
+
+    def _replay(self, changes):
+        if changes is None:
+            return False
+        for i, value, kind in changes:
+            row, col = divmod(i, self.board.size)
+            self.board.set_cell(row, col, value)
+            if kind == "hint":
+                # An undone hint is no longer excluded from points, a redone one is again
+                if value:
+                    self.hint_filled_cells.add((row, col))
+                else:
+                    self.hint_filled_cells.discard((row, col))
+        return True
+
     def count_filled_cells(self):
         # Count how many user-filled (non-hint) cells are filled
         count = 0
-        for i in range(9):
-            for j in range(9):
-                if self.board.original_board[i][j] == 0 and self.board.board[i][j] != 0:
-                    if (i, j) not in self.hint_filled_cells:
-                        count += 1
+        size = self.board.size
+        for i, value in enumerate(self.board.cells):
+            if value != 0 and self.board.givens[i] == 0:
+                if divmod(i, size) not in self.hint_filled_cells:
+                    count += 1
         return count
 
+    def peek_hint(self):
+        # The hint get_hint would give (a Hint, see HintEngine) without applying it, cached per board state
+        return self.hint_engine.next_hint(self.board)
+
     def get_hint(self):
-        # Provide a hint by revealing a correct number from the solution
-        empty_cells = [
-            (row, col)
-            for row in range(9)
-            for col in range(9)
-            if self.board.board[row][col] == 0
-        ]
-
-        if empty_cells:
-            row, col = random.choice(empty_cells)
-            hint = self.board.get_cell_hint(row, col)
-            if hint:
-                self.board.board[row][col] = hint  # Fill cell with hint
-                self.hints_used += 1
-                self.last_hint = (row, col)
-                self.hint_filled_cells.add((row, col))  # Mark as hint-filled (excluded from points)
-                return (row, col, hint)
-        return None
+        # Fill the easiest deducible empty cell, returns (row, col, digit) or None when no cell is empty.
+        # Never touches a cell the player filled, even with a wrong digit
+        hint = self.peek_hint()
+        if hint is None or self.board.cells[hint.row * self.board.size + hint.col]:
+            return None
+        row, col = hint.row, hint.col
+        self._change(row, col, hint.digit, "hint")  # Fill cell with hint
+        self.hints_used += 1
+        self.last_hint = (row, col)
+        self.last_hint_reason = hint.reason
+        self.hint_filled_cells.add((row, col))  # Mark as hint-filled (excluded from points)
+        return (row, col, hint.digit)
+
+    @property
+    def conflict_cells(self):
+        # Cells (row, col) whose digit repeats in their row, column or box, updated per move by the board
+        size = self.board.size
+        return {divmod(i, size) for i in self.board.conflict_cells}
 
     def is_completed(self):
-        # Check if puzzle is solved correctly (no zeroes, valid structure)
-        board = self.board.board
-
-        # Check rows and columns
-        for row in board:
-            if 0 in row or len(set(row)) != 9:
-                return False
-
-        for col in range(9):
-            column = [board[row][col] for row in range(9)]
-            if len(set(column)) != 9:
-                return False
-
-        # Check 3x3 boxes
-        for box_x in range(3):
-            for box_y in range(3):
-                block = []
-                for i in range(box_y * 3, (box_y + 1) * 3):
-                    for j in range(box_x * 3, (box_x + 1) * 3):
-                        block.append(board[i][j])
-                if len(set(block)) != 9:
-                    return False
-
-        return True
+        # Check if puzzle is solved correctly (no zeroes, valid structure), tracked incrementally by the board
+        return self.board.is_solved()
+
+    def consume_changes(self):
+        # True once after the board changed, so callers only re-check completion when needed
+        changed = self.board.dirty
+        self.board.dirty = False
+        return changed
 
     def toggle_pause(self):
         # Pause or resume the timer
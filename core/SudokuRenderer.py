@@ -1,4 +1,6 @@
 from core.constants import *
+from core.GridGeometry import symbol
+from core.TextCache import TextCache
 import pygame
 
 
@@ -18,135 +20,225 @@ class SudokuRenderer:
         self.bottom_margin = 100
         self.side_margin = 20
 
-        # Grid calculation
+        # Buttons: Hint, Pause, Exit (right-aligned in the bottom bar)
+        button_width = 117
+        button_height = 52
+        gap = 10
+        button_y = HEIGHT - self.bottom_margin + 20
+        self.exit_button = pygame.Rect(WIDTH - self.side_margin - button_width, button_y, button_width, button_height)
+        self.pause_button = pygame.Rect(self.exit_button.left - gap - button_width, button_y, button_width, button_height)
+        self.hint_button = pygame.Rect(self.pause_button.left - gap - button_width, button_y, button_width, button_height)
+
+        # Every string drawn here is rasterized once; cell digits are pre-rendered per grid size
+        self.text = TextCache()
+
+        # Grid calculation (9x9 until a game sets its own size)
+        self.board_fonts = {9: self.board_font}  # Cell font per grid size
+        self.grid_size = None
+        self.set_grid_size(9)
+
+    def set_grid_size(self, size):
+        # Fit an N x N grid in the same area, scaling the cell font with the cells. Called for every
+        # new game; the cached layers are only rebuilt when the size actually changes
+        if size != self.grid_size:
+            self._layout(size)
+            self.build_layers()
+        self.invalidate()
+
+    def _layout(self, size):
         available_width = WIDTH - 2 * self.side_margin
         available_height = HEIGHT - self.top_margin - self.bottom_margin
-        self.cell_size = min(available_width // 9, available_height // 9)
+        self.grid_size = size
+        self.box_size = int(size ** 0.5)
+        self.cell_size = min(available_width // size, available_height // size)
 
-        self.grid_width = self.cell_size * 9
-        self.grid_height = self.cell_size * 9
+        self.grid_width = self.cell_size * size
+        self.grid_height = self.cell_size * size
         self.grid_origin_x = (WIDTH - self.grid_width) // 2
         self.grid_origin_y = self.top_margin + 35
 
+        if size not in self.board_fonts:
+            self.board_fonts[size] = pygame.font.Font("assets/fonts/nunito_bold.ttf", self.cell_size // 2)
+        self.board_font = self.board_fonts[size]
+        self.text.build_atlas(self.board_font, [symbol(value) for value in range(1, size + 1)], (BLACK, TEAL))
+
+    def build_layers(self):
+        # Composite everything that stays the same during a game once: the empty grid with its lines,
+        # the bars and the buttons. A full frame starts with one blit of the background. Call again
+        # after changing the colors
+        self.cell_layers = {}  # Grid with every cell in one fill color, by color (see _cell_layer)
+        self.background = pygame.Surface((WIDTH, HEIGHT), 0, self.screen)
+        self.background.fill(NIGHT)
+        self._draw_grid_frame(self.background)
+        self.background.blit(self._cell_layer(WHITE), (self.grid_origin_x, self.grid_origin_y))
+
+        # Buttons, except the Pause/Resume label which follows the game state
+        for button, color in ((self.hint_button, LEAF), (self.pause_button, MUSTARD), (self.exit_button, RED)):
+            pygame.draw.rect(self.background, color, button)
+            pygame.draw.rect(self.background, BLACK, button, 2)
+        for button, label, color in ((self.hint_button, "Hint", BLACK), (self.exit_button, "Exit", WHITE)):
+            label_surf = self.text.render(self.button_font, label, color)
+            self.background.blit(label_surf, label_surf.get_rect(center=button.center))
+
+        # Semi-transparent cover of the grid for the pause and game over screens
+        self.overlay = pygame.Surface((self.grid_width, self.grid_height), pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 220))  # RGBA: semi-transparent black
+
+    def _cell_layer(self, color):
+        # The grid with all cells filled in `color`, their borders and the grid lines, so painting a
+        # cell in any state is one blit of its area. Built on first use (hint and conflict colors)
+        layer = self.cell_layers.get(color)
+        if layer is None:
+            layer = pygame.Surface((self.grid_width, self.grid_height), 0, self.screen)
+            layer.fill(color)
+            for i in range(self.grid_size):
+                for j in range(self.grid_size):
+                    cell = (j * self.cell_size, i * self.cell_size, self.cell_size, self.cell_size)
+                    pygame.draw.rect(layer, BLACK, cell, 1)
+
+            for i in range(self.grid_size + 1):
+                line_width = 3 if i % self.box_size == 0 else 1
+                start = i * self.cell_size
+                pygame.draw.line(layer, BLACK, (start, 0), (start, self.grid_height), line_width)  # Vertical
+                pygame.draw.line(layer, BLACK, (0, start), (self.grid_width, start), line_width)  # Horizontal
+            self.cell_layers[color] = layer
+        return layer
+
+    def invalidate(self):
+        # Repaint the whole window on the next frame (new game, new grid size, another screen drew over it)
+        self.full_redraw = True
+        self.drawn_board = None  # (board, cells, conflicts, selected, hint, paused) as last painted
+        self.drawn_elements = None  # (top bar texts, bottom bar texts) as last painted
+        self.dirty_rects = []
+
     def draw_board(self, board, selected_cell, hint_cell=None):
-        self.screen.fill(NIGHT)
-
-        for i in range(9):
-            for j in range(9):
-                x = self.grid_origin_x + j * self.cell_size
-                y = self.grid_origin_y + i * self.cell_size
-
-                # Step 1: Fill cell white
-                pygame.draw.rect(self.screen, WHITE, (x, y, self.cell_size, self.cell_size))
-
-                # Step 2: If it's a hint cell, overlay yellow highlight
-                if hint_cell and (i, j) == hint_cell:
-                    pygame.draw.rect(self.screen, MINT, (x, y, self.cell_size, self.cell_size))
-
-                # Step 3: Draw border
-                pygame.draw.rect(self.screen, BLACK, (x, y, self.cell_size, self.cell_size), 1)
-
-                # Step 4: Draw number
-                if board.board[i][j] != 0:
-                    color = BLACK if board.original_board[i][j] != 0 else TEAL
-                    text = self.board_font.render(str(board.board[i][j]), True, color)
-                    text_rect = text.get_rect(center=(x + self.cell_size // 2, y + self.cell_size // 2))
-                    self.screen.blit(text, text_rect)
-
-        # Draw grid lines
-        for i in range(10):
-            line_width = 3 if i % 3 == 0 else 1
-            start_x = self.grid_origin_x + i * self.cell_size
-            start_y = self.grid_origin_y + i * self.cell_size
-
-            # Vertical
-            pygame.draw.line(self.screen, BLACK, (start_x, self.grid_origin_y),
-                             (start_x, self.grid_origin_y + self.grid_height), line_width)
-            # Horizontal
-            pygame.draw.line(self.screen, BLACK, (self.grid_origin_x, start_y),
-                             (self.grid_origin_x + self.grid_width, start_y), line_width)
-
-        # Selected cell highlight
-        if selected_cell:
-            x = self.grid_origin_x + selected_cell[1] * self.cell_size
-            y = self.grid_origin_y + selected_cell[0] * self.cell_size
-            pygame.draw.rect(self.screen, RED, (x, y, self.cell_size, self.cell_size), 4)
-
-        # Overlay "Game Paused" when paused
-        if getattr(self, 'is_paused', False):
-            overlay = pygame.Surface((self.grid_width, self.grid_height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 220))  # RGBA: semi-transparent black
-            self.screen.blit(overlay, (self.grid_origin_x, self.grid_origin_y))
-
-            pause_text = self.title_font_2.render("GAME PAUSED", True, MUSTARD)
-            pause_rect = pause_text.get_rect(center=(
-                self.grid_origin_x + self.grid_width // 2,
-                self.grid_origin_y + self.grid_height // 2
-            ))
-            self.screen.blit(pause_text, pause_rect)
+        # Retained mode: only cells whose value, highlight or selection changed since the last frame are
+        # painted again (and listed in dirty_rects); everything is repainted after invalidate()
+        if board.size != self.grid_size:
+            self.set_grid_size(board.size)
+        size = board.size
+        cells = bytes(board.cells)
+        conflicts = frozenset(board.conflict_cells)  # Maintained by the board on every move, usually empty
+        selected = selected_cell[0] * size + selected_cell[1] if selected_cell else None
+        hint = hint_cell[0] * size + hint_cell[1] if hint_cell else None
+        paused = getattr(self, 'is_paused', False)
+
+        drawn = self.drawn_board
+        if not drawn or drawn[0] is not board or drawn[5] != paused:
+            self.full_redraw = True  # Another board, or the pause overlay comes or goes
+        if not self.full_redraw:
+            _, drawn_cells, drawn_conflicts, drawn_selected, drawn_hint, _ = drawn
+            changed = set(conflicts ^ drawn_conflicts)
+            if cells != drawn_cells:
+                changed.update(i for i in range(len(cells)) if cells[i] != drawn_cells[i])
+            if selected != drawn_selected:
+                changed.update((selected, drawn_selected))
+            if hint != drawn_hint:
+                changed.update((hint, drawn_hint))
+            changed.discard(None)
+            if changed and paused:
+                self.full_redraw = True  # Keep the pause overlay on top of everything
+            else:
+                for i in changed:
+                    self.dirty_rects.append(self._draw_cell(board, i, i == hint, i in conflicts, i == selected))
+
+        if self.full_redraw:
+            # The background already shows every empty, plain cell
+            self.screen.blit(self.background, (0, 0))
+            for i in range(size * size):
+                if cells[i] or i == hint or i == selected or i in conflicts:
+                    self._draw_cell(board, i, i == hint, i in conflicts, i == selected)
+
+            # Overlay "Game Paused" when paused
+            if paused:
+                self.screen.blit(self.overlay, (self.grid_origin_x, self.grid_origin_y))
+
+                pause_text = self.text.render(self.title_font_2, "GAME PAUSED", MUSTARD)
+                pause_rect = pause_text.get_rect(center=(
+                    self.grid_origin_x + self.grid_width // 2,
+                    self.grid_origin_y + self.grid_height // 2
+                ))
+                self.screen.blit(pause_text, pause_rect)
+            self.drawn_elements = None
+
+        self.drawn_board = (board, cells, conflicts, selected, hint, paused)
+
+    def _draw_grid_frame(self, surface):
+        # Thick outer border, drawn first so its outer half stays when the cells paint their own edges
+        left, top = self.grid_origin_x, self.grid_origin_y
+        right, bottom = left + self.grid_width, top + self.grid_height
+        for start, end in (((left, top), (left, bottom)), ((right, top), (right, bottom)),
+                           ((left, top), (right, top)), ((left, bottom), (right, bottom))):
+            pygame.draw.line(surface, BLACK, start, end, 3)
+
+    def _draw_cell(self, board, i, is_hint, is_conflict, is_selected):
+        # Paint one cell, returns its rectangle
+        row, col = divmod(i, board.size)
+        x = self.grid_origin_x + col * self.cell_size
+        y = self.grid_origin_y + row * self.cell_size
+        rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
+
+        # Step 1: Cell background in its state's color (white, hint, conflict) with borders and grid lines
+        color = SALMON if is_conflict else MINT if is_hint else WHITE
+        self.screen.blit(self._cell_layer(color), rect, rect.move(-self.grid_origin_x, -self.grid_origin_y))
+
+        # Step 2: Draw number
+        value = board.cells[i]
+        if value != 0:
+            color = BLACK if board.givens[i] != 0 else TEAL
+            text = self.text.render(self.board_font, symbol(value), color)
+            text_rect = text.get_rect(center=rect.center)
+            self.screen.blit(text, text_rect)
+
+        # Step 3: Selected cell highlight
+        if is_selected:
+            pygame.draw.rect(self.screen, RED, rect, 4)
+        return rect
 
     def draw_elements(self, time_string, is_paused, hints_used, current_points, show_level_up=False):
-        # Top bar (Time and Points)
-        pygame.draw.rect(self.screen, NIGHT, (0, 0, WIDTH, self.top_margin))
-
-        timer_text = self.timer_font.render(f"Time: {time_string}", True, WHITE)
-        points_text = self.timer_font.render(f"Points: {current_points}", True, WHITE)
-        self.screen.blit(timer_text, (self.side_margin, 20))
-        points_rect = points_text.get_rect(topright=(WIDTH - self.side_margin, 20))
-        self.screen.blit(points_text, points_rect)
-
-        # Level up message
-        if show_level_up:
-            level_up_text = self.button_font.render("LEVEL UP!", True, RED)
-            level_up_rect = level_up_text.get_rect(center=(WIDTH // 2, self.top_margin // 2))
-            self.screen.blit(level_up_text, level_up_rect)
+        # Each bar is painted again only when one of its texts changed (the timer: once a second)
+        top = (time_string, current_points, show_level_up)
+        bottom = (hints_used, is_paused)
+        drawn_top, drawn_bottom = self.drawn_elements or (None, None)
+
+        # Top bar (Time and Points), down to the grid since the timer text is taller than the bar
+        if top != drawn_top:
+            top_bar = pygame.Rect(0, 0, WIDTH, self.grid_origin_y - 2)
+            self.screen.blit(self.background, top_bar, top_bar)
+
+            timer_text = self.text.render(self.timer_font, f"Time: {time_string}", WHITE)
+            points_text = self.text.render(self.timer_font, f"Points: {current_points}", WHITE)
+            self.screen.blit(timer_text, (self.side_margin, 20))
+            points_rect = points_text.get_rect(topright=(WIDTH - self.side_margin, 20))
+            self.screen.blit(points_text, points_rect)
+
+            # Level up message
+            if show_level_up:
+                level_up_text = self.text.render(self.button_font, "LEVEL UP!", RED)
+                level_up_rect = level_up_text.get_rect(center=(WIDTH // 2, self.top_margin // 2))
+                self.screen.blit(level_up_text, level_up_rect)
+            self.dirty_rects.append(top_bar)
 
         # Bottom bar
-        pygame.draw.rect(self.screen, NIGHT, (0, HEIGHT - self.bottom_margin, WIDTH, self.bottom_margin))
-        bottom_y = HEIGHT - self.bottom_margin + 30
+        if bottom != drawn_bottom:
+            bottom_bar = pygame.Rect(0, HEIGHT - self.bottom_margin, WIDTH, self.bottom_margin)
+            self.screen.blit(self.background, bottom_bar, bottom_bar)  # Bar and buttons
+            bottom_y = HEIGHT - self.bottom_margin + 30
 
-        hints_text = self.timer_font.render(f"Hints Used: {hints_used}", True, WHITE)
-        self.screen.blit(hints_text, (self.side_margin, bottom_y-10))
+            hints_text = self.text.render(self.timer_font, f"Hints Used: {hints_used}", WHITE)
+            self.screen.blit(hints_text, (self.side_margin, bottom_y-10))
 
-        # Buttons: Hint, Pause, Exit
-        button_width = 117
-        button_height = 52
-        gap = 10
+            pause_text = "Resume" if is_paused else "Pause"
+            pause_text_surf = self.text.render(self.button_font, pause_text, BLACK)
+            pause_text_rect = pause_text_surf.get_rect(center=self.pause_button.center)
+            self.screen.blit(pause_text_surf, pause_text_rect)
+            self.dirty_rects.append(bottom_bar)
 
-        # Right-align buttons
-        exit_button = pygame.Rect(WIDTH - self.side_margin - button_width, bottom_y-10, button_width, button_height)
-        pause_button = pygame.Rect(exit_button.left - gap - button_width, bottom_y-10, button_width, button_height)
-        hint_button = pygame.Rect(pause_button.left - gap - button_width, bottom_y-10, button_width, button_height)
-
-        # Draw Hint button
-        pygame.draw.rect(self.screen, LEAF, hint_button)
-        pygame.draw.rect(self.screen, BLACK, hint_button, 2)
-        hint_text_surf = self.button_font.render("Hint", True, BLACK)
-        hint_text_rect = hint_text_surf.get_rect(center=hint_button.center)
-        self.screen.blit(hint_text_surf, hint_text_rect)
-
-        # Draw Pause button
-        pygame.draw.rect(self.screen, MUSTARD, pause_button)
-        pygame.draw.rect(self.screen, BLACK, pause_button, 2)
-        pause_text = "Resume" if is_paused else "Pause"
-        pause_text_surf = self.button_font.render(pause_text, True, BLACK)
-        pause_text_rect = pause_text_surf.get_rect(center=pause_button.center)
-        self.screen.blit(pause_text_surf, pause_text_rect)
-
-        # Draw Exit button
-        pygame.draw.rect(self.screen, RED, exit_button)
-        pygame.draw.rect(self.screen, BLACK, exit_button, 2)
-        exit_text_surf = self.button_font.render("Exit", True, WHITE)
-        exit_text_rect = exit_text_surf.get_rect(center=exit_button.center)
-        self.screen.blit(exit_text_surf, exit_text_rect)
-
-        return pause_button, hint_button, exit_button
+        self.drawn_elements = (top, bottom)
+        return self.pause_button, self.hint_button, self.exit_button
 
     def draw_game_over_screen(self, time_str, hints_used, mistakes, points_gained):
-        overlay = pygame.Surface((self.grid_width, self.grid_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))  # Semi-transparent black
-
-        self.screen.blit(overlay, (self.grid_origin_x, self.grid_origin_y))
+        self.screen.blit(self.overlay, (self.grid_origin_x, self.grid_origin_y))
 
         # Center the text in the overlay
         lines = [
@@ -158,7 +250,7 @@ class SudokuRenderer:
         ]
 
         for i, line in enumerate(lines):
-            text_surf = self.gameover_font.render(line, True, MUSTARD)
+            text_surf = self.text.render(self.gameover_font, line, MUSTARD)
             text_rect = text_surf.get_rect(center=(
                 self.grid_origin_x + self.grid_width // 2,
                 self.grid_origin_y + 145 + i * 50
@@ -166,10 +258,16 @@ class SudokuRenderer:
             self.screen.blit(text_surf, text_rect)
 
         pygame.display.flip()
+        self.invalidate()
 
     def set_paused(self, paused):
         self.is_paused = paused
 
-    @staticmethod
-    def update_display():
-        pygame.display.flip()
+    def update_display(self):
+        # Push only the regions painted this frame, or the whole window after a full repaint
+        if self.full_redraw:
+            pygame.display.flip()
+        elif self.dirty_rects:
+            pygame.display.update(self.dirty_rects)
+        self.full_redraw = False
+        self.dirty_rects = []
@@ -0,0 +1,43 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    def __init__(self, max_entries=256):
+        # Rendered text surfaces keyed by (font, text, color), so drawing a frame is blits only.
+        # Changing strings (timer, points) live in a least-recently-used cache; the atlas holds
+        # glyphs that are always needed (cell digits) and is never evicted
+        self.cache = OrderedDict()
+        self.atlas = {}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def build_atlas(self, font, texts, colors):
+        # Pre-render every text in every color, e.g. the symbols of a grid size in given/user colors
+        for text in texts:
+            for color in colors:
+                key = (font, text, color)
+                if key not in self.atlas:
+                    self.atlas[key] = font.render(text, True, color)
+
+    def render(self, font, text, color):
+        # Same result as font.render(text, True, color), rasterized once per key
+        key = (font, text, color)
+        surface = self.atlas.get(key)
+        if surface is None:
+            surface = self.cache.get(key)
+            if surface is None:
+                self.misses += 1
+                surface = font.render(text, True, color)
+                self.cache[key] = surface
+                if len(self.cache) > self.max_entries:
+                    self.cache.popitem(last=False)
+                return surface
+            self.cache.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def get_stats(self):
+        lookups = self.hits + self.misses
+        return {"size": len(self.cache), "atlas": len(self.atlas), "hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
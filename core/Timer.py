@@ -31,6 +31,12 @@ class Timer:
         self.elapsed_time = 0
         self.running = True
 
+    def ms_until_next_second(self):
+        # Milliseconds until get_time_string changes, or None while paused (it will not change)
+        if not self.running:
+            return None
+        return 1000 - int((time.time() - self.start_time) * 1000) % 1000
+
     def get_time_string(self):
         # Return the elapsed time as a formatted string MM:SS
         minutes, seconds = divmod(int(self.elapsed_time), 60)
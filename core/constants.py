@@ -26,6 +26,7 @@ WIDTH, HEIGHT = int(540 * 1.3), int(660 * 1.3)  # 702, 858
 BOARD_SIZE = int(540 * 1.3)  # 702
 CELL_SIZE = BOARD_SIZE // 9  # This will now be 78 (702/9)
 TIMER_HEIGHT = HEIGHT - BOARD_SIZE  # 858 - 702 = 156
+FPS = 60  # Frame cap while something animates, idle screens only redraw on events
 
 AVATARS = {
     "Bear": pygame.image.load("assets/avatars/bear.png"),
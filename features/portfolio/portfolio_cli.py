@@ -0,0 +1,90 @@
+"""
+Solve, count or generate puzzles by racing several solver configurations in worker processes
+(see SolverPortfolio): the first definitive answer wins and the other workers are stopped.
+
+A puzzle is given as a string of N*N symbols (1-9 then A-P, "." or "0" for empty cells, other
+characters such as line breaks are ignored) or as the path of a file holding one.
+
+Usage (from the project root):
+    python -m features.portfolio.portfolio_cli PUZZLE [--count 2] [--workers 4] [--timeout 10]
+    python -m features.portfolio.portfolio_cli --generate hard [--box-size 4] [--seed 7]
+"""
+import argparse
+import os
+import sys
+
+from core.GridGeometry import SYMBOLS, symbol
+from core.SolverBudget import SolverBudget
+from core.SolverPortfolio import DEFAULT_CONFIGS, SolverPortfolio
+from core.SudokuBoard import REMOVAL_RATIOS
+
+EMPTY = ".0"
+
+
+def parse_puzzle(text):
+    # Flat list of values from a puzzle string, ignoring anything that is not a cell
+    if os.path.isfile(text):
+        with open(text, "r") as file:
+            text = file.read()
+    return [0 if ch in EMPTY else SYMBOLS.index(ch) + 1 for ch in text.upper() if ch in EMPTY or ch in SYMBOLS]
+
+
+def format_grid(cells):
+    size = int(len(cells) ** 0.5)
+    return "\n".join(" ".join(symbol(value) or "." for value in cells[row * size:row * size + size])
+                     for row in range(size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Race solver configurations across worker processes.")
+    parser.add_argument("puzzle", nargs="?", help="puzzle string or file (not needed with --generate)")
+    parser.add_argument("--count", type=int, metavar="LIMIT", help="count solutions up to LIMIT instead of solving")
+    parser.add_argument("--generate", metavar="DIFFICULTY", choices=list(REMOVAL_RATIOS),
+                        help=f"generate a puzzle of this difficulty ({', '.join(REMOVAL_RATIOS)})")
+    parser.add_argument("--box-size", type=int, default=3, help="board size for --generate (3 = 9x9, 4 = 16x16)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for --generate")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"worker processes (default: CPU count, at most {len(DEFAULT_CONFIGS)})")
+    parser.add_argument("--timeout", type=float, default=None, help="give up after this many seconds")
+    parser.add_argument("--max-nodes", type=int, default=None, help="search node budget per worker call")
+    args = parser.parse_args()
+    if not args.generate and not args.puzzle:
+        parser.error("a puzzle is required unless --generate is used")
+    if args.seed < 0:
+        parser.error("--seed must not be negative (puzzle IDs only hold non-negative seeds)")
+
+    portfolio = SolverPortfolio(workers=args.workers)
+    budget = SolverBudget(max_nodes=args.max_nodes, max_seconds=args.timeout)
+    try:
+        if args.generate:
+            result = portfolio.generate(args.generate, args.box_size, seed=args.seed, budget=budget)
+        else:
+            cells = parse_puzzle(args.puzzle)
+            if args.count:
+                result = portfolio.count_solutions(cells, args.count, budget)
+            else:
+                result = portfolio.solve(cells, budget)
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(f"{result.status} in {result.seconds * 1000:.1f}ms"
+          + (f" by {result.config}" if result.config else "")
+          + f" ({len(portfolio.configs)} workers)")
+    if result.status == "error":
+        print(result.value)
+    if result.status != "solved":
+        sys.exit(1)
+
+    if args.generate:
+        board = result.value
+        if board.puzzle_id:
+            print(f"Puzzle ID: {board.puzzle_id}")
+        print(format_grid(board.givens))
+    elif args.count:
+        print(f"{result.value} solution(s) (limit {args.count})")
+    else:
+        print(format_grid(result.value))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Generate puzzles offline with a process pool and write them to a binary puzzle bank.
+
+Writes one <difficulty>.bank file per difficulty (see bank_format.py) and an index.json
+listing the files, record counts and record size.
+
+Usage (from the project root):
+    python -m features.puzzle_bank.bank_builder --count 100000 [--difficulties easy hard]
+        [--out data/puzzle_bank] [--workers 8] [--seed 42] [--rated] [--derive 50 | --dedupe]
+
+--derive N searches one puzzle in every N and derives the others from it with symmetry
+transforms (see PuzzleTransformer), which is far faster but yields groups of isomorphic puzzles.
+--dedupe drops puzzles that are symmetric copies of one already written (see PuzzleIndex)
+and generates replacements.
+"""
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.DifficultyRater import DIFFICULTY_BANDS
+from core.PuzzleIndex import PuzzleIndex
+from core.SudokuBoard import SudokuBoard
+from features.puzzle_bank import bank_format
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_OUTPUT_DIR = os.path.join(BASE_DIR, "data", "puzzle_bank")
+BATCH_SIZE = 500
+
+
+def generate_batch(difficulty, count, seed, rated, derive=1):
+    # Runs in a worker process: returns (`count` packed records, puzzles skipped because their rating
+    # missed the band). Every batch reseeds (from the OS when seed is None) so forked workers never
+    # repeat each other's puzzles
+    random.seed(seed)
+    low, high = DIFFICULTY_BANDS[difficulty]
+    records = bytearray()
+    index = skipped = 0
+    while index < count:
+        board = SudokuBoard(difficulty=difficulty)
+        if index % derive == 0:
+            board.generate(rating_band=difficulty if rated else None)
+            if rated and not low <= board.rating["level"] <= high:
+                skipped += 1  # generate() only got close to the band, try another puzzle
+                continue
+            source = board
+        else:
+            board.derive_from(source.givens, source.solution, source.rating)
+        records += bank_format.pack_record(board.board, board.solution_board)
+        index += 1
+    return bytes(records), skipped
+
+
+def build_difficulty(executor, difficulty, count, out_dir, seed, rated, derive=1, index=None):
+    # Write the header with a zero count first, append batches as they finish, then patch the count.
+    # With a PuzzleIndex, duplicates are dropped and further batches run until `count` are written
+    path = os.path.join(out_dir, bank_format.bank_filename(difficulty))
+    written = duplicates = skipped = batch_number = 0
+    with open(path, "wb") as file:
+        file.write(bank_format.pack_header(difficulty, 0))
+        while written < count:
+            remaining = count - written
+            batches = [min(BATCH_SIZE, remaining - start) for start in range(0, remaining, BATCH_SIZE)]
+            seeds = [None if seed is None else f"{seed}:{difficulty}:{batch_number + number}"
+                     for number in range(len(batches))]
+            batch_number += len(batches)
+
+            for records, batch_skipped in executor.map(generate_batch, [difficulty] * len(batches), batches, seeds,
+                                        [rated] * len(batches), [derive] * len(batches)):
+                skipped += batch_skipped
+                if index is None:
+                    file.write(records)
+                    written += len(records) // bank_format.RECORD_SIZE
+                else:
+                    for start in range(0, len(records), bank_format.RECORD_SIZE):
+                        record = records[start:start + bank_format.RECORD_SIZE]
+                        if index.add(bank_format.unpack_cells(record)):
+                            file.write(record)
+                            written += 1
+                        else:
+                            duplicates += 1
+                print(f"\r{difficulty}: {written}/{count}", end="", flush=True)
+        file.seek(0)
+        file.write(bank_format.pack_header(difficulty, written))
+    notes = []
+    if index is not None:
+        notes.append(f"{duplicates} duplicates dropped")
+    if rated:
+        notes.append(f"{skipped} skipped outside the rating band")
+    print(f" ({', '.join(notes)})" if notes else "")
+    return written
+
+
+def write_index(out_dir, counts):
+    # Merge with an existing index so difficulties can be built separately
+    path = os.path.join(out_dir, bank_format.INDEX_FILENAME)
+    index = {"version": bank_format.FORMAT_VERSION, "record_size": bank_format.RECORD_SIZE, "difficulties": {}}
+    if os.path.exists(path):
+        with open(path, "r") as file:
+            index["difficulties"] = json.load(file).get("difficulties", {})
+
+    for difficulty, count in counts.items():
+        index["difficulties"][difficulty] = {"file": bank_format.bank_filename(difficulty), "count": count}
+
+    with open(path, "w") as file:
+        json.dump(index, file, indent=4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a binary puzzle bank with a process pool.")
+    parser.add_argument("--count", type=int, required=True, help="puzzles per difficulty")
+    parser.add_argument("--difficulties", nargs="+", default=list(bank_format.DIFFICULTY_CODES),
+                        choices=list(bank_format.DIFFICULTY_CODES))
+    parser.add_argument("--out", default=DEFAULT_OUTPUT_DIR, help="output directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--seed", type=int, default=None, help="base seed for a reproducible bank")
+    parser.add_argument("--rated", action="store_true",
+                        help="only write puzzles whose technique rating falls in the difficulty's band "
+                             "(others are skipped and counted)")
+    parser.add_argument("--derive", type=int, default=1,
+                        help="puzzles per searched puzzle, the rest derived by symmetry transforms")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="drop puzzles that are symmetric copies of one already in the bank")
+    args = parser.parse_args()
+    if args.dedupe and args.derive > 1:
+        parser.error("--dedupe would drop every derived puzzle, use --derive or --dedupe")
+
+    os.makedirs(args.out, exist_ok=True)
+    counts = {}
+    index = PuzzleIndex() if args.dedupe else None  # Shared, so no puzzle appears under two difficulties
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for difficulty in args.difficulties:
+            start = time.perf_counter()
+            counts[difficulty] = build_difficulty(executor, difficulty, args.count, args.out, args.seed,
+                                                  args.rated, max(args.derive, 1), index)
+            elapsed = time.perf_counter() - start
+            print(f"{difficulty}: {counts[difficulty]} puzzles in {elapsed:.1f}s "
+                  f"({counts[difficulty] / elapsed:.0f}/s)")
+
+    write_index(args.out, counts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import struct
+
+# Binary puzzle bank layout (one file per difficulty):
+#   header  - magic, format version, box size, difficulty code, record size, record count
+#   records - fixed-width: the puzzle then its solution, 4 bits per cell (81 cells -> 41 bytes each)
+MAGIC = b"DOKU"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sBBBxII")
+
+CELL_COUNT = 81
+PACKED_GRID_SIZE = (CELL_COUNT + 1) // 2
+RECORD_SIZE = 2 * PACKED_GRID_SIZE
+
+DIFFICULTY_CODES = {"easy": 0, "medium": 1, "hard": 2, "advanced": 3}
+INDEX_FILENAME = "index.json"
+
+
+def bank_filename(difficulty):
+    return f"{difficulty}.bank"
+
+
+def pack_header(difficulty, count):
+    return HEADER.pack(MAGIC, FORMAT_VERSION, 3, DIFFICULTY_CODES[difficulty], RECORD_SIZE, count)
+
+
+def unpack_header(data):
+    # Returns (difficulty code, record size, record count), raising ValueError for foreign files
+    magic, version, box_size, difficulty_code, record_size, count = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a puzzle bank file")
+    if version != FORMAT_VERSION or box_size != 3:
+        raise ValueError(f"Unsupported puzzle bank format (version {version}, box size {box_size})")
+    return difficulty_code, record_size, count
+
+
+def pack_grid(grid):
+    # 9x9 list of lists -> 41 bytes, two cells per byte (high nibble first)
+    cells = [value for row in grid for value in row] + [0]
+    return bytes((cells[i] << 4) | cells[i + 1] for i in range(0, CELL_COUNT, 2))
+
+
+def unpack_cells(data):
+    # 41 bytes (any buffer, e.g. a memoryview slice) -> 81 cell values as flat bytes
+    cells = bytearray(PACKED_GRID_SIZE * 2)
+    packed = data[:PACKED_GRID_SIZE]
+    cells[0::2] = bytes(byte >> 4 for byte in packed)
+    cells[1::2] = bytes(byte & 0x0F for byte in packed)
+    return bytes(cells[:CELL_COUNT])
+
+
+def unpack_grid(data):
+    # 41 bytes -> 9x9 list of lists
+    cells = unpack_cells(data)
+    return [list(cells[row * 9:row * 9 + 9]) for row in range(9)]
+
+
+def pack_record(puzzle, solution):
+    return pack_grid(puzzle) + pack_grid(solution)
@@ -0,0 +1,85 @@
+import json
+import mmap
+import os
+import random
+
+from core.SudokuBoard import SudokuBoard
+from features.puzzle_bank import bank_format
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_BANK_DIR = os.path.join(BASE_DIR, "data", "puzzle_bank")
+
+
+class PuzzleBankFile:
+    def __init__(self, path, difficulty):
+        # Map one <difficulty>.bank file read-only; records are decoded on demand, never loaded as a whole
+        self.path = path
+        self.difficulty = difficulty
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        _, self.record_size, self.count = bank_format.unpack_header(self._view)
+        if bank_format.HEADER.size + self.count * self.record_size > len(self._map):
+            self.close()
+            raise ValueError(f"Truncated puzzle bank: {path}")
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        # Sequential iteration in file order
+        for index in range(self.count):
+            yield self.get_board(index)
+
+    def get_board(self, index):
+        # O(1): seek straight to the fixed-width record and decode it from the mapped memory
+        if not 0 <= index < self.count:
+            raise IndexError(f"Puzzle index {index} out of range (bank has {self.count})")
+        start = bank_format.HEADER.size + index * self.record_size
+        record = self._view[start:start + self.record_size]
+
+        board = SudokuBoard(difficulty=self.difficulty)
+        board.load(
+            bank_format.unpack_cells(record[:bank_format.PACKED_GRID_SIZE]),
+            bank_format.unpack_cells(record[bank_format.PACKED_GRID_SIZE:])
+        )
+        record.release()
+        return board
+
+    def random_board(self, rng=random):
+        return self.get_board(rng.randrange(self.count))
+
+    def close(self):
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+
+class PuzzleBank:
+    def __init__(self, directory=DEFAULT_BANK_DIR):
+        # Open every difficulty listed in the bank's index.json
+        with open(os.path.join(directory, bank_format.INDEX_FILENAME), "r") as file:
+            index = json.load(file)
+
+        self.files = {}
+        for difficulty, entry in index.get("difficulties", {}).items():
+            path = os.path.join(directory, entry["file"])
+            if os.path.exists(path):
+                self.files[difficulty] = PuzzleBankFile(path, difficulty)
+
+    @staticmethod
+    def is_available(directory=DEFAULT_BANK_DIR):
+        return os.path.exists(os.path.join(directory, bank_format.INDEX_FILENAME))
+
+    def take(self, difficulty):
+        # Puzzle source interface used by SudokuGame: a random puzzle, or None if the bank has none
+        bank_file = self.files.get(difficulty)
+        if not bank_file or not len(bank_file):
+            return None
+        return bank_file.random_board()
+
+    def close(self):
+        for bank_file in self.files.values():
+            bank_file.close()
+        self.files.clear()
@@ -10,15 +10,24 @@ from core.Leaderboard import Leaderboard
 from core.PlayScreen import PlayScreen
 from core.HowToPlay import HowToPlay
 from core.GameStatsScreen import GameStatsScreen
+from core.PuzzlePool import PuzzlePool
+from core.PuzzleIndex import PuzzleIndex
+from core.PuzzleCache import PuzzleCache
+from features.puzzle_bank.bank_reader import PuzzleBank
+import argparse
 import pygame
 
 
 class GameController:
-    def __init__(self):
+    def __init__(self, puzzle_id=None, fps=FPS):
         # Initialize the game window
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Doku+")
 
+        # Frame pacing: at most `fps` frames per second, and no frames at all while nothing changes
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+
         # Store user session info
         self.logged_in_user = None
         self.user_avatar = None
@@ -42,6 +51,21 @@ class GameController:
         self.game = None
         self.renderer = SudokuRenderer(self.screen)
 
+        # Draw puzzles from a prebuilt bank if one exists, otherwise generate them in the background
+        # so starting a game never waits for generation
+        if PuzzleBank.is_available():
+            self.puzzle_source = PuzzleBank()
+        else:
+            self.puzzle_source = PuzzlePool(depth=3)
+            self.puzzle_source.start()
+
+        # Every puzzle served so far, so new games avoid repeats (also under symmetry)
+        self.played_puzzles = PuzzleIndex("data/played_puzzles.bin")
+
+        # Puzzles requested by ID are generated once, then read back from disk
+        self.puzzle_cache = PuzzleCache("data/puzzle_cache")
+        self.challenge_id = puzzle_id  # Puzzle ID to play first (--puzzle), whatever difficulty is picked
+
         # Track current screen state: "auth", "menu", or "play"
         self.state = "auth"
 
@@ -72,22 +96,35 @@ class GameController:
         # Move to the menu screen
         self.state = "menu"
 
+    def wait_for_events(self, animating=False, wake_ms=None):
+        # Events for the next frame. Unless something is animating, block until an event arrives (or
+        # wake_ms passes, e.g. when the timer display changes) instead of drawing frames nobody needs
+        self.clock.tick(self.fps)
+        if animating:
+            return pygame.event.get()
+        event = pygame.event.wait(max(wake_ms, 1)) if wake_ms is not None else pygame.event.wait()
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
     def run(self):
         running = True
         while running:
+            # Every screen draws its current state first, then waits for the events that change it
+
             # AUTH SCREEN
             if self.state == "auth":
-                for event in pygame.event.get():
+                self.auth_screen.draw()
+                for event in self.wait_for_events():
                     if event.type == pygame.QUIT:
                         running = False
                     else:
                         self.auth_screen.handle_event(event)
-                self.auth_screen.draw()
 
             # MAIN MENU
             elif self.state == "menu":
                 self.menu.draw(self.point_tracker, self.logged_in_user, self.user_avatar)
-                for event in pygame.event.get():
+                for event in self.wait_for_events():
                     if event.type == pygame.QUIT:
                         running = False
                     elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -119,7 +156,8 @@ class GameController:
                     self.game_stats_screen.generate_stats_once()
                     self.stats_generated = True
 
-                for event in pygame.event.get():
+                self.game_stats_screen.draw()
+                for event in self.wait_for_events():
                     if event.type == pygame.QUIT:
                         running = False
                     else:
@@ -128,12 +166,10 @@ class GameController:
                             self.state = "menu"
                             self.stats_generated = False  # Reset for next visit
 
-                self.game_stats_screen.draw()
-
             # PLAY SELECTION SCREEN (Easy, Medium, Hard, Advanced)
             elif self.state == "play_select":
                 self.play_screen.draw()
-                for event in pygame.event.get():
+                for event in self.wait_for_events():
                     if event.type == pygame.QUIT:
                         running = False
                     elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -141,18 +177,31 @@ class GameController:
                         if result == "menu":
                             self.state = "menu"
                         elif result in ["easy", "medium", "hard", "advanced"]:
-                            self.game = SudokuGame(
-                                difficulty=result,
+                            game_options = dict(
                                 point_tracker=self.point_tracker,
-                                renderer=self.renderer
+                                renderer=self.renderer,
+                                played_puzzles=self.played_puzzles,
+                                puzzle_cache=self.puzzle_cache
                             )
+                            if self.challenge_id:
+                                self.game = SudokuGame.from_puzzle_id(self.challenge_id, **game_options)
+                                self.challenge_id = None
+                            else:
+                                self.game = SudokuGame(
+                                    difficulty=result,
+                                    puzzle_source=self.puzzle_source,
+                                    box_size=self.play_screen.box_size,
+                                    **game_options
+                                )
                             self.game.start_new_game()
+                            if self.game.board.puzzle_id:
+                                print(f"Puzzle ID: {self.game.board.puzzle_id}")
                             self.state = "play"
 
             # LEADERBOARD SCREEN
             elif self.state == "leaderboard":
                 self.leaderboard_screen.draw()
-                for event in pygame.event.get():
+                for event in self.wait_for_events():
                     if event.type == pygame.QUIT:
                         running = False
                     else:
@@ -163,7 +212,7 @@ class GameController:
             # HOW TO PLAY SCREEN
             elif self.state == "howto":
                 self.how_to_play_screen.draw()
-                for event in pygame.event.get():
+                for event in self.wait_for_events():
                     if event.type == pygame.QUIT:
                         running = False
                     else:
@@ -187,8 +236,11 @@ class GameController:
                     self.game.count_filled_cells(),
                     self.level_up_message_timer > 0
                 )
+                self.renderer.update_display()
 
-                for event in pygame.event.get():
+                # Only the level up message animates; otherwise wake up when the timer display changes
+                events = self.wait_for_events(self.level_up_message_timer > 0, self.game.timer.ms_until_next_second())
+                for event in events:
                     if event.type == pygame.QUIT:
                         running = False
                     elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -204,7 +256,7 @@ class GameController:
                                 hint = self.game.get_hint()
                                 if hint:
                                     self.hint_sound.play()
-                                    print(f"Hint: {hint}")
+                                    print(f"Hint: {hint} - {self.game.last_hint_reason}")
                             elif exit_button.collidepoint(event.pos):
                                 self.exit_sound.play()
                                 self.state = "menu"
@@ -217,6 +269,19 @@ class GameController:
                             pygame.K_5, pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9
                         ]:
                             self.game.input_number(int(pygame.key.name(event.key)))
+                        elif event.mod & pygame.KMOD_CTRL and event.key == pygame.K_z:
+                            # Ctrl+Z undo, Ctrl+Shift+Z redo
+                            if event.mod & pygame.KMOD_SHIFT:
+                                self.game.redo()
+                            else:
+                                self.game.undo()
+                        elif event.mod & pygame.KMOD_CTRL and event.key == pygame.K_y:
+                            self.game.redo()
+                        elif (event.mod & pygame.KMOD_SHIFT and pygame.K_a <= event.key <= pygame.K_p
+                              and 10 + (event.key - pygame.K_a) <= self.game.board.size):
+                            # Values 10-25 on large boards are typed as Shift + A-P, other letters
+                            # (Shift+C, Shift+H on 9x9 and 16x16) keep their commands below
+                            self.game.input_number(10 + event.key - pygame.K_a)
                         elif event.key in [pygame.K_DELETE, pygame.K_BACKSPACE]:
                             self.game.delete_input()
                         elif event.key == pygame.K_c:
@@ -225,14 +290,13 @@ class GameController:
                             hint = self.game.get_hint()
                             if hint:
                                 self.hint_sound.play()
-                                print(f"Hint: {hint}")
-
-                self.renderer.update_display()
+                                print(f"Hint: {hint} - {self.game.last_hint_reason}")
 
                 if self.level_up_message_timer > 0:
                     self.level_up_message_timer -= 1
 
-                if self.game.is_completed():
+                # Only re-check completion after a move actually changed the board
+                if self.game.consume_changes() and self.game.is_completed():
                     stats = self.game.get_completion_stats()
                     self.stats_tracker.log_game(
                         self.game.difficulty,
@@ -255,10 +319,25 @@ class GameController:
                     pygame.time.wait(2000)
                     self.state = "menu"
 
+        self.puzzle_source.close()
         pygame.quit()
 
 
 # Entry point for the game
 if __name__ == "__main__":
-    controller = GameController()
+    parser = argparse.ArgumentParser(description="Doku+ Sudoku")
+    parser.add_argument("--puzzle", metavar="ID", help="play the puzzle with this ID first (e.g. a shared challenge)")
+    parser.add_argument("--fps", type=int, default=FPS, help=f"frame cap while animating (default: {FPS})")
+    args = parser.parse_args()
+
+    if args.puzzle:
+        try:
+            parse_puzzle_id(args.puzzle)
+        except ValueError as error:
+            parser.error(str(error))
+
+    if args.fps < 1:
+        parser.error("--fps must be at least 1")
+
+    controller = GameController(puzzle_id=args.puzzle, fps=args.fps)
     controller.run()